@@ -0,0 +1,31 @@
+"""
+CV Extraction Core
+Shared text extraction, structured extraction, model cascade, deadlines and
+profiling for cv_parser.py and cv_extractor.py
+"""
+
+from .deadline import Deadline, DeadlineExceeded, unbounded
+from .extraction import ExtractionCore, decode_json
+from .profiling import JobProfiler
+from .providers import get_provider, register_provider, shared_client
+from .readers import read_text, register_reader, supported_extensions
+from .schema import CV_SCHEMA, to_extractor_result, to_parser_result, validate
+
+__all__ = [
+    "CV_SCHEMA",
+    "Deadline",
+    "DeadlineExceeded",
+    "ExtractionCore",
+    "JobProfiler",
+    "decode_json",
+    "get_provider",
+    "read_text",
+    "register_provider",
+    "register_reader",
+    "shared_client",
+    "supported_extensions",
+    "to_extractor_result",
+    "to_parser_result",
+    "unbounded",
+    "validate",
+]
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+CV Model Cascade
+Runs extraction through cheap tiers first and escalates only on failure:
+local heuristics -> small model -> larger model
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from .deadline import MIN_CALL_SECONDS, Deadline
+
+# Load environment variables
+load_dotenv()
+
+HEURISTIC_TIER = "heuristic"
+
+# Default tier order; override with CV_CASCADE_TIERS
+DEFAULT_TIERS = [HEURISTIC_TIER, "gpt-4.1-mini", "gpt-4.1"]
+DEFAULT_MIN_CONFIDENCE = 0.85
+
+
+def configured_tiers() -> List[str]:
+    """Read the tier order from CV_CASCADE_TIERS, e.g. "heuristic,gpt-4.1-mini" """
+    raw = os.getenv("CV_CASCADE_TIERS")
+    if not raw:
+        return list(DEFAULT_TIERS)
+    return [tier.strip() for tier in raw.split(",") if tier.strip()]
+
+
+def parse_min_confidence(value: str) -> float:
+    """Parse a heuristic confidence threshold, a number from 0 to 1"""
+    try:
+        threshold = float(value)
+    except ValueError:
+        threshold = float("nan")
+    if not 0 <= threshold <= 1:
+        raise ValueError(f"minimum confidence must be a number from 0 to 1, got {value!r}")
+    return threshold
+
+
+def configured_min_confidence() -> float:
+    """Read the heuristic acceptance threshold from CV_HEURISTIC_MIN_CONFIDENCE"""
+    value = os.getenv("CV_HEURISTIC_MIN_CONFIDENCE")
+    if not value:
+        return DEFAULT_MIN_CONFIDENCE
+    try:
+        return parse_min_confidence(value)
+    except ValueError as e:
+        # A bad environment value must not fail every job
+        print(f"Ignoring CV_HEURISTIC_MIN_CONFIDENCE: {str(e)}", file=sys.stderr)
+        return DEFAULT_MIN_CONFIDENCE
+
+
+class ModelCascade:
+    """Try each tier in order until one returns output that passes validation.
+
+    ``heuristic`` is a local ``text -> (data, confidence)`` function; its
+    output is only accepted above ``min_confidence``. Every other tier is a
+    model name handed to the ``call_model(model, text)`` callable supplied to
+    ``run``. Per-attempt outcomes and latencies are returned with the result
+    and, when ``stats_path`` is set, appended to a JSONL log for ``summarize``.
+    ``usable`` screens invalid model output before it may become the fallback.
+    """
+
+    def __init__(self, shape: str, validator: Callable[[Any], List[str]],
+                 heuristic: Optional[Callable[[str], Tuple[Dict[str, Any], float]]] = None,
+                 tiers: Optional[List[str]] = None, min_confidence: Optional[float] = None,
+                 stats_path: Optional[str] = None, usable: Optional[Callable[[Any], bool]] = None):
+        self.shape = shape
+        self.validator = validator
+        self.heuristic = heuristic
+        self.tiers = tiers or configured_tiers()
+        self.min_confidence = min_confidence if min_confidence is not None else configured_min_confidence()
+        self.stats_path = stats_path if stats_path is not None else os.getenv("CV_CASCADE_STATS_FILE")
+        self.usable = usable
+
+    def run(self, text: str, call_model: Callable[[str, str], str],
+            decode: Callable[[str], Any] = json.loads,
+            deadline: Optional[Deadline] = None) -> Tuple[Optional[Any], Dict[str, Any]]:
+        """Run the cascade on CV text.
+
+        Returns ``(data, report)``. ``data`` is the first validated output.
+        Failing that it is the best usable model candidate, then the
+        heuristic result even below ``min_confidence`` (a model outage should
+        not lose what was already extracted locally), and None only when
+        nothing usable came back at all. ``report["accepted"]`` says whether a
+        tier was accepted and ``report["fallback_tier"]`` where an unaccepted
+        result came from. With a ``deadline``, no model tier is
+        started once too little time is left and ``report["deadline_exceeded"]``
+        is set; ``call_model`` is expected to bound its own request timeout.
+        """
+        attempts: List[Dict[str, Any]] = []
+        fallback: Optional[Any] = None
+        fallback_errors: Optional[int] = None
+        fallback_tier: Optional[str] = None
+        heuristic_candidate: Optional[Any] = None
+        accepted_tier: Optional[str] = None
+        data: Optional[Any] = None
+        deadline_exceeded = False
+
+        for tier in self.tiers:
+            if deadline is not None and tier != HEURISTIC_TIER and deadline.remaining() <= MIN_CALL_SECONDS:
+                attempts.append({"tier": tier, "outcome": "deadline"})
+                deadline_exceeded = True
+                break
+            started = time.perf_counter()
+            attempt: Dict[str, Any] = {"tier": tier}
+            try:
+                if tier == HEURISTIC_TIER:
+                    if self.heuristic is None:
+                        continue
+                    candidate, confidence = self.heuristic(text)
+                    attempt["confidence"] = confidence
+                else:
+                    candidate = decode(call_model(tier, text))
+                errors = self.validator(candidate)
+            except Exception as e:
+                attempt.update(outcome="error", error=str(e)[:200],
+                               latency_ms=round((time.perf_counter() - started) * 1000, 1))
+                attempts.append(attempt)
+                continue
+
+            attempt["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            if errors:
+                attempt.update(outcome="invalid", errors=errors[:10])
+            elif tier == HEURISTIC_TIER and attempt["confidence"] < self.min_confidence:
+                attempt["outcome"] = "low_confidence"
+            else:
+                attempt["outcome"] = "accepted"
+            attempts.append(attempt)
+
+            if attempt["outcome"] == "accepted":
+                accepted_tier = tier
+                data = candidate
+                break
+            # Heuristic output never stands in for a model answer, only for no answer
+            if tier == HEURISTIC_TIER:
+                heuristic_candidate = None if errors else candidate
+            elif self.usable is not None and not self.usable(candidate):
+                attempt["outcome"] = "unusable"
+            elif fallback_errors is None or len(errors) < fallback_errors:
+                fallback, fallback_errors, fallback_tier = candidate, len(errors), tier
+
+        if not accepted_tier and fallback is None and heuristic_candidate is not None:
+            fallback, fallback_tier = heuristic_candidate, HEURISTIC_TIER
+
+        report = {
+            "shape": self.shape,
+            "tier": accepted_tier,
+            "accepted": accepted_tier is not None,
+            "fallback_tier": None if accepted_tier else fallback_tier,
+            "deadline_exceeded": deadline_exceeded or bool(deadline and not accepted_tier and deadline.expired()),
+            "attempts": attempts,
+            "latency_ms": round(sum(a.get("latency_ms", 0) for a in attempts), 1),
+        }
+        self._record(report)
+        return (data if accepted_tier else fallback), report
+
+    def _record(self, report: Dict[str, Any]):
+        """Append the run to the stats log; stats must never break a parse"""
+        if not self.stats_path:
+            return
+        entry = {"ts": time.time(), **report}
+        try:
+            with open(self.stats_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"Cascade stats not recorded: {str(e)}", file=sys.stderr)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(stats_path: str, shape: Optional[str] = None) -> Dict[str, Any]:
+    """Aggregate a cascade stats log into per-tier hit rates and latencies.
+
+    ``reached`` counts runs that got as far as a tier, ``hit_rate`` is the
+    share of those the tier resolved, and ``share`` is the share of all runs
+    it resolved - the number to watch when tuning cost against quality.
+    """
+    runs = 0
+    unresolved = 0
+    tiers: Dict[str, Dict[str, Any]] = {}
+    with open(stats_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if shape and entry.get("shape") != shape:
+                continue
+            runs += 1
+            if not entry.get("accepted"):
+                unresolved += 1
+            for attempt in entry.get("attempts", []):
+                tier = tiers.setdefault(attempt["tier"], {"reached": 0, "accepted": 0, "outcomes": {}, "latencies": []})
+                tier["reached"] += 1
+                outcome = attempt.get("outcome", "unknown")
+                tier["outcomes"][outcome] = tier["outcomes"].get(outcome, 0) + 1
+                if outcome == "accepted":
+                    tier["accepted"] += 1
+                if "latency_ms" in attempt:
+                    tier["latencies"].append(attempt["latency_ms"])
+
+    summary: Dict[str, Any] = {"runs": runs, "unresolved": unresolved, "tiers": {}}
+    for name, tier in tiers.items():
+        latencies = tier.pop("latencies")
+        summary["tiers"][name] = {
+            **tier,
+            "hit_rate": round(tier["accepted"] / tier["reached"], 3) if tier["reached"] else 0.0,
+            "share": round(tier["accepted"] / runs, 3) if runs else 0.0,
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+            },
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize model cascade hit rates and latency')
+    parser.add_argument('stats_file', nargs='?', default=os.getenv('CV_CASCADE_STATS_FILE'),
+                        help='Cascade stats JSONL file (defaults to CV_CASCADE_STATS_FILE)')
+    parser.add_argument('--shape', help='Only include runs for one output shape')
+
+    args = parser.parse_args()
+    if not args.stats_file:
+        parser.error('No stats file given and CV_CASCADE_STATS_FILE is not set')
+
+    print(json.dumps(summarize(args.stats_file, args.shape), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+CV Job Deadlines
+Time budgets passed down through extraction so jobs finish with partial results
+instead of being killed
+"""
+
+import os
+import sys
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+# Time kept back for assembling and printing the result once work stops
+DEFAULT_RESERVE_SECONDS = 2.0
+# Shortest OpenAI call worth starting
+MIN_CALL_SECONDS = 3.0
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a stage cannot start or finish within the job budget"""
+
+
+class Deadline:
+    """Wall-clock budget for one job.
+
+    ``Deadline(None)`` never expires, so callers can always pass one down.
+    Stages call ``check()`` before starting work and ``client()`` to get an
+    OpenAI client whose timeout is whatever is left of the budget. Anything
+    cut short is recorded with ``note()`` and reported in the result.
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None, expires_at: Optional[float] = None,
+                 reserve_seconds: float = DEFAULT_RESERVE_SECONDS):
+        self.started_at = time.time()
+        if expires_at is None and budget_seconds is not None:
+            expires_at = self.started_at + budget_seconds
+        self.expires_at = expires_at
+        self.reserve_seconds = reserve_seconds
+        self.events: List[str] = []
+
+    @classmethod
+    def from_options(cls, budget: Optional[float] = None, deadline: Optional[float] = None) -> "Deadline":
+        """Build from CLI options, falling back to CV_BUDGET_SECONDS / CV_DEADLINE"""
+        if budget is None:
+            budget = _env_seconds("CV_BUDGET_SECONDS", "--budget")
+        if deadline is None:
+            deadline = _env_seconds("CV_DEADLINE", "--deadline")
+        if budget is not None and deadline is not None:
+            # Honour whichever ends first
+            deadline = min(deadline, time.time() + budget)
+            budget = None
+        return cls(budget_seconds=budget, expires_at=deadline)
+
+    @property
+    def bounded(self) -> bool:
+        return self.expires_at is not None
+
+    def remaining(self) -> float:
+        """Seconds left before the reserve, or infinity when unbounded"""
+        if self.expires_at is None:
+            return float("inf")
+        return self.expires_at - self.reserve_seconds - time.time()
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def check(self, stage: str, needed: float = 0.0):
+        """Raise DeadlineExceeded if there is not ``needed`` time left for a stage"""
+        if self.remaining() <= needed:
+            raise DeadlineExceeded(f"No time left for {stage}")
+
+    def note(self, event: str):
+        self.events.append(event)
+
+    def request_options(self, stage: str) -> Dict[str, Any]:
+        """OpenAI request options that keep a call inside the budget"""
+        if not self.bounded:
+            return {}
+        self.check(stage, MIN_CALL_SECONDS)
+        # No client-side retries: one retry would blow the budget, and the
+        # model cascade already escalates on failure
+        return {"timeout": self.remaining(), "max_retries": 0}
+
+    def client(self, client: Any, stage: str) -> Any:
+        """Return the OpenAI client configured for the remaining budget"""
+        options = self.request_options(stage)
+        return client.with_options(**options) if options else client
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "budget_seconds": round(self.expires_at - self.started_at, 1) if self.bounded else None,
+            "elapsed_seconds": round(time.time() - self.started_at, 2),
+            "events": self.events,
+        }
+
+
+def unbounded() -> Deadline:
+    """A deadline that never expires"""
+    return Deadline()
+
+
+def parse_seconds(option: str, value: str) -> float:
+    """Parse a --budget/--deadline value, raising ValueError with a readable message"""
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{option} expects a number of seconds, got {value!r}") from None
+    if not math.isfinite(seconds) or seconds <= 0:
+        raise ValueError(f"{option} must be a positive number of seconds, got {value!r}")
+    return seconds
+
+
+def _env_seconds(name: str, option: str) -> Optional[float]:
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return parse_seconds(option, value)
+    except ValueError as e:
+        # A bad environment value must not fail every job
+        print(f"Ignoring {name}: {str(e)}", file=sys.stderr)
+        return None
+
+
+def pop_cli_options(argv: List[str]) -> Dict[str, Any]:
+    """Remove --budget SECONDS / --deadline EPOCH_SECONDS from argv in place.
+
+    Raises ValueError for a missing or malformed value so the caller can
+    report it.
+    """
+    options: Dict[str, Any] = {"budget": None, "deadline": None}
+    index = 0
+    while index < len(argv):
+        key, _, inline = argv[index].partition("=")
+        if key in ("--budget", "--deadline"):
+            argv.pop(index)
+            value = inline or (argv.pop(index) if index < len(argv) else "")
+            if not value:
+                raise ValueError(f"{key} expects a value")
+            options[key[2:]] = parse_seconds(key, value)
+        else:
+            index += 1
+    return options
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+CV Extraction Core
+Text extraction and structured CV extraction shared by cv_parser.py and cv_extractor.py
+"""
+
+import re
+import sys
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import heuristics
+from .cascade import HEURISTIC_TIER, ModelCascade
+from .deadline import Deadline, DeadlineExceeded, unbounded
+from .providers import get_provider
+from .readers import read_text
+from .schema import is_usable, validate
+
+SYSTEM_PROMPT = """
+You are an expert CV parser. Extract structured information from the provided CV text.
+
+Return a JSON object with the following structure:
+{
+  "personal_info": {
+    "name": "Full name",
+    "email": "email@example.com",
+    "phone": "+1234567890",
+    "location": "City, Country",
+    "linkedin": "https://linkedin.com/in/username",
+    "github": "https://github.com/username",
+    "website": "https://example.com",
+    "portfolio": "https://portfolio.com",
+    "other_urls": ["url1", "url2"]
+  },
+  "tagline": "Professional tagline",
+  "professional_summary": "Brief professional summary or objective",
+  "work_experience": [
+    {
+      "title": "Job Title",
+      "company": "Company Name",
+      "location": "City, Country",
+      "start_date": "MM/YYYY",
+      "end_date": "MM/YYYY or Present",
+      "duration": "2 years 3 months",
+      "description": "Brief description of role and key responsibilities:\\n\\n- Bullet one\\n- Bullet two",
+      "achievements": ["Specific achievement 1", "Achievement 2"],
+      "technologies": ["Tech1", "Tech2"]
+    }
+  ],
+  "education": [
+    {
+      "degree": "Degree Name",
+      "institution": "University/School Name",
+      "location": "City, Country",
+      "start_date": "YYYY",
+      "end_date": "YYYY",
+      "gpa": "3.8/4.0",
+      "notes": "Optional notes",
+      "relevant_courses": ["Course 1", "Course 2"]
+    }
+  ],
+  "skills": {
+    "technical": ["Skill1", "Skill2"],
+    "programming": ["Language1", "Language2"],
+    "tools": ["Tool1", "Tool2"],
+    "soft_skills": ["Communication", "Leadership"]
+  },
+  "certifications": [
+    {
+      "name": "Certification Name",
+      "issuer": "Issuing Organization",
+      "date": "MM/YYYY",
+      "expiry": "MM/YYYY",
+      "credential_id": "ID123"
+    }
+  ],
+  "languages": [
+    {
+      "language": "English",
+      "proficiency": "Native/Fluent/Intermediate/Basic"
+    }
+  ],
+  "projects": [
+    {
+      "name": "Project Name",
+      "description": "Project description",
+      "technologies": ["Tech1", "Tech2"],
+      "url": "https://project-url.com",
+      "date": "MM/YYYY"
+    }
+  ],
+  "achievements": ["Achievement 1", "Achievement 2"],
+  "interests": ["Photography", "Hiking"]
+}
+
+IMPORTANT:
+- Extract only information that is explicitly present in the CV
+- Use null for missing information
+- If a section is completely missing, return an empty array []
+- Be accurate with dates, names, and details
+- Preserve original descriptions and bullet points exactly
+- For bullet points, use simple hyphens (-) at the start of lines, not asterisks (*) or double bullets like '* -'
+- Order the experience by date (most recent first)
+- Return each skill, tool and interest as a separate array element, not as comma-separated strings
+- Return raw JSON only: no markdown, no backticks, no extra commentary
+"""
+
+USER_PROMPT = "Extract structured information from this CV:\n\n{cv_text}"
+
+
+def decode_json(content: str) -> Any:
+    """Parse a model response as JSON, recovering it from fences or surrounding text"""
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        # Clean the response text first
+        cleaned_content = content.strip()
+
+        # Multiple regex patterns to handle different response formats
+        json_patterns = [
+            # JSON wrapped in markdown code blocks
+            r'```json\s*(\{.*?\})\s*```',
+            r'```\s*(\{.*?\})\s*```',
+            # JSON in the response (greedy match for complete object)
+            r'(\{(?:[^{}]|{[^}]*})*\})',
+            # Look for the start of JSON and capture everything until the end
+            r'\{.*',
+        ]
+
+        for pattern in json_patterns:
+            json_match = re.search(pattern, cleaned_content, re.DOTALL)
+            if json_match:
+                try:
+                    json_text = json_match.group(1) if len(json_match.groups()) > 0 else json_match.group(0)
+                    structured_data = json.loads(json_text.strip())
+                    print(f"✅ Successfully parsed JSON using pattern: {pattern[:30]}...", file=sys.stderr)
+                    return structured_data
+                except json.JSONDecodeError as parse_error:
+                    print(f"❌ Pattern {pattern[:30]}... failed: {str(parse_error)}", file=sys.stderr)
+                    continue
+
+        # Log the full response for debugging
+        print(f"🔍 Raw model response: {content[:1000]}...", file=sys.stderr)
+        raise Exception(f"Could not extract valid JSON from model response. Raw response: {content[:500]}...")
+
+
+class ExtractionCore:
+    """File reading and structured extraction behind both CV command-line tools.
+
+    Output is always the ``schema.CV_SCHEMA`` shape; callers adapt it with
+    ``to_parser_result`` or ``to_extractor_result``.
+    """
+
+    def __init__(self, provider: Any = None, pdf_mode: Optional[str] = None,
+                 tiers: Optional[List[str]] = None, api_key: Optional[str] = None):
+        self._provider = provider
+        self._api_key = api_key
+        self.pdf_mode = pdf_mode
+        self.cascade = ModelCascade("cv", validate, heuristic=heuristics.extract, tiers=tiers,
+                                    usable=is_usable)
+
+    @property
+    def provider(self) -> Any:
+        """The LLM provider, built on first use so reading files needs no credentials"""
+        if self._provider is None:
+            self._provider = get_provider(api_key=self._api_key)
+        return self._provider
+
+    def read_text(self, file_path: str, deadline: Optional[Deadline] = None) -> str:
+        """Extract plain text from a PDF, Word or text file"""
+        return read_text(file_path, deadline, self.pdf_mode)
+
+    def extract_structured(self, cv_text: str,
+                           deadline: Optional[Deadline] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run the model cascade and return the structured CV with its cascade report.
+
+        When no tier is accepted the best candidate is returned, falling back
+        to the local heuristics, with ``accepted`` false in the report. Raises
+        DeadlineExceeded instead if that happened because the budget ran out
+        before any model answered, so the caller can record a partial result
+        and use ``local_structured``.
+        """
+        deadline = deadline or unbounded()
+
+        def call_model(model: str, text: str) -> str:
+            return self.provider.complete(
+                model,
+                [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": USER_PROMPT.format(cv_text=text)}
+                ],
+                deadline=deadline,
+                stage=f"structured data ({model})",
+                temperature=0.1,  # Low temperature for consistent extraction
+                max_tokens=8000
+            )
+
+        # Heuristics first, then cheap model, escalating only on invalid output
+        structured_data, cascade_report = self.cascade.run(cv_text, call_model, decode=decode_json,
+                                                           deadline=deadline)
+        fallback_tier = cascade_report["fallback_tier"]
+        if cascade_report["deadline_exceeded"] and not cascade_report["accepted"] and \
+                fallback_tier in (None, HEURISTIC_TIER):
+            raise DeadlineExceeded("Structured extraction ran out of time")
+        if structured_data is None:
+            raise Exception("No cascade tier returned usable JSON")
+        if not cascade_report["accepted"]:
+            print(f"No cascade tier was accepted, using best candidate from {fallback_tier}", file=sys.stderr)
+        return structured_data, cascade_report
+
+    def local_structured(self, cv_text: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Structured CV from the local heuristics alone, used when the budget runs out"""
+        structured_data, confidence = heuristics.extract(cv_text)
+        return structured_data, {"shape": self.cascade.shape, "tier": HEURISTIC_TIER, "accepted": False,
+                                 "fallback_tier": HEURISTIC_TIER,
+                                 "confidence": confidence, "deadline_exceeded": True}
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+CV Heuristic Extractor
+Local, rule-based extraction used as the first tier of the model cascade
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Section headings we recognise, mapped to the section they start
+SECTION_HEADINGS = {
+    "summary": "Summary",
+    "profile": "Summary",
+    "professional summary": "Summary",
+    "about me": "Summary",
+    "objective": "Summary",
+    "experience": "Experience",
+    "work experience": "Experience",
+    "professional experience": "Experience",
+    "employment history": "Experience",
+    "career history": "Experience",
+    "education": "Education",
+    "education and training": "Education",
+    "qualifications": "Education",
+    "skills": "Skills",
+    "key skills": "Skills",
+    "core skills": "Skills",
+    "technical skills": "Skills",
+    "core competencies": "Skills",
+    "tools": "Tools",
+    "technologies": "Tools",
+    "tools and technologies": "Tools",
+    "achievements": "Achievements",
+    "key achievements": "Achievements",
+    "accomplishments": "Achievements",
+    "interests": "Interests",
+    "hobbies": "Interests",
+    "hobbies and interests": "Interests",
+}
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_RE = re.compile(r"(\+?\d[\d\s().-]{7,}\d)")
+URL_RE = re.compile(r"(?:https?://)?(?:www\.)?[\w-]+\.[\w.-]+/[\w./?=&%#-]*")
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+DATE_RANGE_RE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*(?P<end>{_DATE}|present|current|now)",
+    re.IGNORECASE,
+)
+
+BULLET_RE = re.compile(r"^\s*(?:[-*•●▪◦‣]|\d+[.)])\s*")
+
+# "Title at Company" fixes the order; "A | B" and "A - B" only separate
+AT_RE = re.compile(r"\s+(?:at|@)\s+", re.IGNORECASE)
+SEPARATOR_RE = re.compile(r"\s*\|\s*|\s+[-–—]\s+")
+
+# Words that mark the role half of an experience/education heading
+TITLE_RE = re.compile(
+    r"\b(?:manager|engineer|developer|analyst|director|owner|consultant|designer|lead|head|officer|"
+    r"specialist|architect|scientist|intern|assistant|coordinator|administrator|executive|associate|"
+    r"president|founder|co-founder|teacher|lecturer|researcher|accountant|advisor|adviser|strategist|"
+    r"programmer|technician|supervisor|editor|writer|producer|recruiter|nurse|vp|cto|ceo|cfo|coo|"
+    r"trainee|apprentice)s?\b",
+    re.IGNORECASE,
+)
+DEGREE_RE = re.compile(
+    r"\b(?:b\.?sc|m\.?sc|b\.?a|m\.?a|b\.?eng|m\.?eng|ph\.?d|mba|bachelor|master|diploma|degree|"
+    r"certificate|a[- ]levels?|gcses?|hnd|doctorate)s?\b",
+    re.IGNORECASE,
+)
+
+
+def _heading_key(line: str) -> Optional[str]:
+    """Return the output key if the line is a section heading"""
+    cleaned = line.strip().strip(":").strip().lower()
+    if not cleaned or len(cleaned) > 40:
+        return None
+    return SECTION_HEADINGS.get(cleaned.replace("&", "and"))
+
+
+def _split_items(lines: Iterable[str]) -> List[str]:
+    """Split a skills-style section into individual items"""
+    items: List[str] = []
+    for line in lines:
+        line = BULLET_RE.sub("", line)
+        # "Languages: Python, Go" -> keep only the list part
+        if ":" in line and len(line.split(":", 1)[0]) < 30:
+            line = line.split(":", 1)[1]
+        for item in re.split(r"[,;|•·]", line):
+            item = item.strip()
+            if item and len(item) <= 60:
+                items.append(item)
+    return items
+
+
+def _clean_bullets(lines: List[str]) -> List[str]:
+    return [BULLET_RE.sub("", line).strip() for line in lines if line.strip()]
+
+
+def _split_header(head_lines: List[str], lexicon: re.Pattern) -> Tuple[str, str, str, bool]:
+    """Split an entry's heading lines into title, organisation and location.
+
+    Returns ``confident`` only when the split is unambiguous: an explicit
+    separator (``Title at Company``, ``Title | Company``) or exactly one side
+    matching ``lexicon``, and no more than two parts in total. Anything else
+    ("Acme Bank" over "Senior Product Manager" with no marker, or an extra
+    location part) is still split as well as possible but should be left to
+    the model.
+    """
+    segments: List[str] = []
+    explicit = ordered = False
+    for head in head_lines:
+        marker = None if explicit else (AT_RE.search(head) or SEPARATOR_RE.search(head))
+        if marker:
+            explicit, ordered = True, bool(AT_RE.fullmatch(marker.group(0)))
+            segments.extend([head[:marker.start()], head[marker.end():]])
+        else:
+            segments.append(head)
+    segments = [segment.strip() for segment in segments if segment.strip()]
+    parts = [p for segment in segments for p in re.split(r"\s*,\s+", segment) if p]
+    if len(segments) == 1:
+        segments = parts
+    if not segments:
+        return "", "", "", False
+
+    hits = [bool(lexicon.search(segment)) for segment in segments[:2]]
+    if not ordered and hits == [False, True]:
+        # Organisation-first heading, e.g. "Acme Bank" above "Product Manager"
+        segments[0], segments[1] = segments[1], segments[0]
+    title = segments[0]
+    organisation, *location = re.split(r"\s*,\s+", segments[1]) if len(segments) > 1 else [""]
+    location.extend(segments[2:])
+
+    confident = (bool(title and organisation) and len(parts) <= 2
+                 and (explicit or hits.count(True) == 1))
+    return title, organisation, ", ".join(location), confident
+
+
+def _parse_dated_entries(lines: List[str], lexicon: re.Pattern) -> Tuple[List[Dict[str, Any]], int]:
+    """Split an experience/education section on date ranges.
+
+    Each entry starts at the line holding a date range; the heading lines just
+    above it (up to two) are split into title and organisation by
+    ``_split_header``. Returns the
+    entries and the number of lines that could not be assigned to one.
+    """
+    anchors = [i for i, line in enumerate(lines) if DATE_RANGE_RE.search(line)]
+    if not anchors:
+        return [], len(lines)
+
+    entries: List[Dict[str, Any]] = []
+    starts: List[int] = []
+    for anchor in anchors:
+        match = DATE_RANGE_RE.search(lines[anchor])
+        header = lines[anchor][:match.start()].strip(" ,|-–—")
+        head_lines = [header] if header else []
+        start = anchor
+        # Pull title/company from the preceding lines if the date line is bare
+        while len(head_lines) < 2 and start > 0 and (not starts or start - 1 > starts[-1]):
+            previous = lines[start - 1].strip()
+            if not previous or BULLET_RE.match(previous) or DATE_RANGE_RE.search(previous):
+                break
+            head_lines.insert(0, previous)
+            start -= 1
+        starts.append(start)
+
+        title, organisation, location, confident = _split_header(head_lines, lexicon)
+        entries.append({
+            "title": title,
+            "organisation": organisation,
+            "location": location,
+            "confident": confident,
+            "start": match.group("start"),
+            "end": match.group("end").title() if match.group("end").isalpha() else match.group("end"),
+            "anchor": anchor,
+        })
+
+    for index, entry in enumerate(entries):
+        body_end = starts[index + 1] if index + 1 < len(entries) else len(lines)
+        body = [line for line in lines[entry.pop("anchor") + 1:body_end] if line.strip()]
+        entry["description"] = "\n".join(
+            f"- {BULLET_RE.sub('', line).strip()}" if BULLET_RE.match(line) else line.strip()
+            for line in body
+        )
+
+    unassigned = starts[0]
+    return entries, unassigned
+
+
+def extract(cv_text: str) -> Tuple[Dict[str, Any], float]:
+    """Extract a structured CV (see schema.CV_SCHEMA) from plain text with a confidence score.
+
+    The score is the share of a fixed checklist that was satisfied (name,
+    email, experience and education headings that split without ambiguity,
+    skills, and how much of the text landed in a recognised section). The
+    cascade only accepts results above its configured threshold, so a low
+    score simply means "ask the model".
+    """
+    lines = [line.rstrip() for line in cv_text.replace("\\n", "\n").split("\n")]
+    sections: Dict[str, List[str]] = {}
+    header_lines: List[str] = []
+    current: Optional[str] = None
+    for line in lines:
+        key = _heading_key(line)
+        if key:
+            current = key
+            sections.setdefault(key, [])
+        elif current:
+            sections[current].append(line)
+        else:
+            header_lines.append(line)
+
+    header_text = "\n".join(header_lines)
+    email_match = EMAIL_RE.search(header_text) or EMAIL_RE.search(cv_text)
+    phone_match = PHONE_RE.search(header_text)
+    urls = [u for u in URL_RE.findall(header_text) if "@" not in u]
+
+    name = ""
+    tagline = ""
+    for line in header_lines:
+        stripped = line.strip()
+        if not stripped or EMAIL_RE.search(stripped) or PHONE_RE.search(stripped) or URL_RE.search(stripped):
+            continue
+        if not name:
+            words = stripped.split()
+            if 2 <= len(words) <= 4 and all(w[:1].isupper() for w in words) and not any(c.isdigit() for c in stripped):
+                name = stripped
+                continue
+        if name and not tagline and len(stripped) < 80:
+            tagline = stripped
+
+    experience_entries, unassigned_exp = _parse_dated_entries(sections.get("Experience", []), TITLE_RE)
+    education_entries, unassigned_edu = _parse_dated_entries(sections.get("Education", []), DEGREE_RE)
+
+    data = {
+        "personal_info": {
+            "name": name,
+            "email": email_match.group(0) if email_match else "",
+            "phone": phone_match.group(1).strip() if phone_match else "",
+            "location": "",
+            "linkedin": next((u for u in urls if "linkedin" in u.lower()), ""),
+            "github": next((u for u in urls if "github" in u.lower()), ""),
+            "website": "",
+            "portfolio": "",
+            "other_urls": [u for u in urls if "linkedin" not in u.lower() and "github" not in u.lower()],
+        },
+        "tagline": tagline,
+        "professional_summary": " ".join(l.strip() for l in sections.get("Summary", []) if l.strip()),
+        "work_experience": [{
+            "title": e["title"],
+            "company": e["organisation"],
+            "location": e["location"],
+            "start_date": e["start"],
+            "end_date": e["end"],
+            "description": e["description"],
+        } for e in experience_entries],
+        "education": [{
+            "degree": e["title"],
+            "institution": e["organisation"],
+            "location": e["location"],
+            "start_date": e["start"],
+            "end_date": e["end"],
+            "notes": e["description"],
+        } for e in education_entries],
+        "skills": {
+            "technical": _split_items(l for l in sections.get("Skills", []) if l.strip()),
+            "tools": _split_items(l for l in sections.get("Tools", []) if l.strip()),
+        },
+        "achievements": _clean_bullets(sections.get("Achievements", [])),
+        "interests": _split_items(l for l in sections.get("Interests", []) if l.strip()),
+    }
+
+    content_lines = [l for l in lines if l.strip()]
+    sectioned = sum(len([l for l in body if l.strip()]) for body in sections.values()) + len(sections)
+    header_content = len([l for l in header_lines if l.strip()])
+    unassigned = unassigned_exp + unassigned_edu
+    coverage = (sectioned + min(header_content, 6) - unassigned) / max(len(content_lines), 1)
+
+    checks = [
+        bool(name),
+        bool(email_match),
+        bool(experience_entries) and all(e["confident"] for e in experience_entries),
+        "Education" not in sections or (bool(education_entries) and all(e["confident"] for e in education_entries)),
+        bool(data["skills"]["technical"] or data["skills"]["tools"]),
+        coverage >= 0.9,
+    ]
+    confidence = sum(checks) / len(checks)
+    return data, round(confidence, 3)
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+CV Layout Extraction
+Single-pass PDF extraction that detects columns and emits text in reading order
+"""
+
+import os
+import sys
+import json
+import bisect
+import hashlib
+import argparse
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import fitz  # PyMuPDF
+from dotenv import load_dotenv
+
+from .deadline import Deadline
+
+# Load environment variables
+load_dotenv()
+
+# Left edges within this share of the page width start the same column
+START_TOLERANCE_RATIO = 0.02
+# A new column needs at least this many lines aligned on its left edge
+MIN_COLUMN_LINES = 2
+# ...and at most this share of the lines to its left may run across the gutter
+GUTTER_CROSSING_SHARE = 0.5
+# Overlap (in points) before a line counts as reaching into another column
+SPAN_TOLERANCE = 2.0
+# Columns narrower than this share of the page are merged into a neighbour
+# when they are slivers: a few lines (page numbers) or lone glyphs (icons)
+MIN_COLUMN_RATIO = 0.08
+MAX_SLIVER_LINES = 3
+MAX_GLYPH_CHARS = 2
+# Narrow right-hand columns whose lines all share rows with the column to
+# their left are table cells (dates, locations) rather than a sidebar
+MAX_CELL_COLUMN_RATIO = 0.2
+MIN_CELL_ALIGNED_SHARE = 0.9
+# Vertical gap, relative to line height, that still joins lines into one block
+BLOCK_GAP_RATIO = 0.6
+# Blocks whose tops are this close (in points) are on the same row
+ROW_TOLERANCE = 3.0
+CACHE_VERSION = 3
+MEMORY_CACHE_SIZE = 32
+
+_memory_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def pdf_mode() -> str:
+    """PDF extraction mode from CV_PDF_MODE: "plain" (default) or "layout" """
+    mode = os.getenv("CV_PDF_MODE", "plain").strip().lower()
+    return mode if mode in ("plain", "layout") else "plain"
+
+
+def _line_records(block: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a get_text("dict") block into lines with their dominant font.
+
+    Lines rather than blocks are the clustering unit because PyMuPDF often
+    builds one block per visual row, spanning both columns of a two-column
+    template.
+    """
+    records: List[Dict[str, Any]] = []
+    for line in block.get("lines", []):
+        parts = []
+        sizes: Dict[float, int] = {}
+        fonts: Dict[str, int] = {}
+        bold_chars = 0
+        total_chars = 0
+        for span in line.get("spans", []):
+            text = span.get("text", "")
+            if not text:
+                continue
+            parts.append(text)
+            length = len(text.strip())
+            total_chars += length
+            size = round(span.get("size", 0), 1)
+            sizes[size] = sizes.get(size, 0) + length
+            fonts[span.get("font", "")] = fonts.get(span.get("font", ""), 0) + length
+            # PyMuPDF flag bit 4 (16) marks bold text
+            if span.get("flags", 0) & 16 or "bold" in span.get("font", "").lower():
+                bold_chars += length
+        text = "".join(parts).strip()
+        if not text:
+            continue
+        records.append({
+            "text": text,
+            "bbox": [round(v, 1) for v in line["bbox"]],
+            "font": max(fonts, key=fonts.get) if fonts else "",
+            "size": max(sizes, key=sizes.get) if sizes else 0,
+            "bold": total_chars > 0 and bold_chars * 2 >= total_chars,
+        })
+    return records
+
+
+def _row_aligned_share(lines: List[Dict[str, Any]], others: List[Dict[str, Any]]) -> float:
+    """Share of ``lines`` whose top lines up with some line in ``others``"""
+    if not lines:
+        return 0.0
+    tops = sorted(line["bbox"][1] for line in others)
+    aligned = 0
+    for line in lines:
+        top = line["bbox"][1]
+        index = bisect.bisect_left(tops, top - ROW_TOLERANCE)
+        if index < len(tops) and tops[index] <= top + ROW_TOLERANCE:
+            aligned += 1
+    return aligned / len(lines)
+
+
+def _is_sliver(column: List[float], lines: List[Dict[str, Any]], page_width: float) -> bool:
+    """A narrow column of only a few lines or glyphs, too little to read on its own"""
+    if column[1] - column[0] >= page_width * MIN_COLUMN_RATIO:
+        return False
+    return len(lines) <= MAX_SLIVER_LINES or all(len(l["text"]) <= MAX_GLYPH_CHARS for l in lines)
+
+
+def _has_heading(lines: List[Dict[str, Any]]) -> bool:
+    """Whether some line stands out from the rest as a heading.
+
+    A heading is set apart from the lines around it: bold among regular
+    lines, larger than the body size, or in capitals among mixed case.
+    A column of cells is uniform, so any of these marks a sidebar.
+    """
+    sizes = sorted(l["size"] for l in lines)
+    body_size = sizes[len(sizes) // 2]
+    # Dates and phone numbers say nothing about case, so only words count
+    words = [l["text"] for l in lines if any(c.isalpha() for c in l["text"])
+             and not any(c.isdigit() for c in l["text"])]
+    if any(text.isupper() for text in words) and not all(text.isupper() for text in words):
+        return True
+    return any((line["bold"] and not all(l["bold"] for l in lines)) or line["size"] > body_size + 0.5
+               for line in lines)
+
+
+def _is_cells(column_lines: List[Dict[str, Any]], left_lines: List[Dict[str, Any]]) -> bool:
+    """Whether a column holds cells for the rows of the column to its left"""
+    if not column_lines or _has_heading(column_lines):
+        return False
+    return _row_aligned_share(column_lines, left_lines) >= MIN_CELL_ALIGNED_SHARE
+
+
+def _find_columns(lines: List[Dict[str, Any]], page_width: float) -> List[List[float]]:
+    """Detect columns from the left edges lines are aligned to.
+
+    Each cluster of left edges is a candidate column start. It only becomes a
+    column when a gutter opens in front of it, i.e. most lines of the column
+    to its left end before it; otherwise it is an indent or a centred heading
+    inside that column. Lines that run across a gutter (a name header, a
+    full-width summary) do not widen the column they start in, so they are
+    never mistaken for the column itself, however wide that column is.
+    """
+    tolerance = page_width * START_TOLERANCE_RATIO
+    clusters: List[List[Dict[str, Any]]] = []
+    for line in sorted(lines, key=lambda l: l["bbox"][0]):
+        if clusters and line["bbox"][0] - clusters[-1][-1]["bbox"][0] <= tolerance:
+            clusters[-1].append(line)
+        else:
+            clusters.append([line])
+
+    groups: List[List[Dict[str, Any]]] = []
+    for cluster in clusters:
+        if groups:
+            start = cluster[0]["bbox"][0]
+            crossing = sum(1 for l in groups[-1] if l["bbox"][2] > start + SPAN_TOLERANCE)
+            if len(cluster) < MIN_COLUMN_LINES or crossing > len(groups[-1]) * GUTTER_CROSSING_SHARE:
+                groups[-1].extend(cluster)
+                continue
+        groups.append(cluster)
+
+    columns: List[List[float]] = []
+    for index, group in enumerate(groups):
+        limit = groups[index + 1][0]["bbox"][0] + SPAN_TOLERANCE if index + 1 < len(groups) else float("inf")
+        inside = [l["bbox"][2] for l in group if l["bbox"][2] <= limit] or [l["bbox"][2] for l in group]
+        columns.append([group[0]["bbox"][0], min(max(inside), limit)])
+
+    def lines_in(column: List[float]) -> List[Dict[str, Any]]:
+        return [l for l in lines if column[0] <= l["bbox"][0] and l["bbox"][2] <= column[1]]
+
+    merged: List[List[float]] = []
+    for column in columns:
+        if not merged:
+            merged.append(column)
+            continue
+        previous = merged[-1]
+        inside, left = lines_in(column), lines_in(previous)
+        # Fold slivers (page numbers, stray icons) into the neighbouring column;
+        # a multi-line column behind a clear gutter stays, however narrow
+        sliver = _is_sliver(column, inside, page_width) or _is_sliver(previous, left, page_width)
+        # Right-hand date/location cells sit on the same rows as the text they
+        # belong to; they are part of that column, not a sidebar
+        cells = not sliver and column[1] - column[0] < page_width * MAX_CELL_COLUMN_RATIO and \
+            _is_cells(inside, left)
+        if sliver or cells:
+            previous[1] = max(previous[1], column[1])
+        else:
+            merged.append(column)
+    return merged
+
+
+def _column_of(line: Dict[str, Any], columns: List[List[float]]) -> int:
+    """Column index for a line, or -1 when it reaches across more than one column"""
+    x0, x1 = line["bbox"][0], line["bbox"][2]
+    overlapping = [index for index, (c0, c1) in enumerate(columns)
+                   if min(x1, c1) - max(x0, c0) > SPAN_TOLERANCE]
+    if len(overlapping) > 1:
+        return -1
+    if overlapping:
+        return overlapping[0]
+    center = (x0 + x1) / 2
+    return min(range(len(columns)), key=lambda i: abs((columns[i][0] + columns[i][1]) / 2 - center))
+
+
+def _order_lines(lines: List[Dict[str, Any]], page_width: float) -> int:
+    """Sort lines into reading order in place and return the number of columns.
+
+    Lines that span columns (name header, full-width paragraphs) cut the page
+    into bands; within a band each column is read top to bottom, left column
+    first. This keeps a sidebar's skills/contact lines together instead of
+    interleaving them with the main column.
+    """
+    columns = _find_columns(lines, page_width)
+    for line in lines:
+        line["column"] = 0 if len(columns) <= 1 else _column_of(line, columns)
+
+    band = 0
+    for line in sorted(lines, key=lambda l: (l["bbox"][1], l["bbox"][0])):
+        if line["column"] == -1:
+            band += 1
+            line["band"] = band
+            band += 1
+        else:
+            line["band"] = band
+    lines.sort(key=lambda l: (l["band"], l["column"], l["bbox"][1], l["bbox"][0]))
+    return max(len(columns), 1)
+
+
+def _group_blocks(lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Regroup ordered lines into blocks of consecutive lines in one column"""
+    blocks: List[Dict[str, Any]] = []
+    previous: Optional[Dict[str, Any]] = None
+    for line in lines:
+        height = line["bbox"][3] - line["bbox"][1]
+        same_block = (
+            previous is not None
+            and line["band"] == previous["band"]
+            and line["column"] == previous["column"]
+            and line["size"] == previous["size"]
+            and line["bold"] == previous["bold"]
+            and 0 <= line["bbox"][1] - previous["bbox"][3] <= height * BLOCK_GAP_RATIO + ROW_TOLERANCE
+        )
+        if same_block:
+            block = blocks[-1]
+            block["text"] += "\n" + line["text"]
+            block["bbox"] = [min(block["bbox"][0], line["bbox"][0]), min(block["bbox"][1], line["bbox"][1]),
+                             max(block["bbox"][2], line["bbox"][2]), max(block["bbox"][3], line["bbox"][3])]
+        else:
+            blocks.append({
+                "text": line["text"],
+                "bbox": list(line["bbox"]),
+                "font": line["font"],
+                "size": line["size"],
+                "bold": line["bold"],
+                "column": line["column"],
+                "order": len(blocks),
+            })
+        previous = line
+    return blocks
+
+
+def _file_key(file_path: str) -> str:
+    """Content hash, so a re-uploaded identical file hits the cache"""
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _disk_cache_path(key: str) -> Optional[str]:
+    cache_dir = os.getenv("CV_LAYOUT_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return os.path.join(cache_dir, f"{key}.v{CACHE_VERSION}.json")
+
+
+def _remember(key: str, layout: Dict[str, Any]):
+    _memory_cache[key] = layout
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def extract_layout(file_path: str, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """Extract a PDF once into reading-ordered blocks with font/position metadata.
+
+    Returns ``{"key", "pages": [{"number", "width", "height", "columns",
+    "blocks": [{"text", "bbox", "font", "size", "bold", "column", "order"}]}],
+    "text", "truncated"}``. Results are cached by file content in memory and,
+    when CV_LAYOUT_CACHE_DIR is set, on disk, so later stages (or another
+    process) can call this again without re-parsing the PDF. Truncated
+    results (deadline hit) are never cached.
+    """
+    key = _file_key(file_path)
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+
+    cache_path = _disk_cache_path(key)
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                layout = json.load(f)
+            _remember(key, layout)
+            return layout
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Ignoring unreadable layout cache {cache_path}: {str(e)}", file=sys.stderr)
+
+    pages: List[Dict[str, Any]] = []
+    truncated = False
+    with fitz.open(file_path) as doc:
+        for page in doc:
+            # Keep the pages we have rather than lose the whole job
+            if deadline is not None and page.number > 0 and deadline.expired():
+                deadline.note(f"text_extraction: stopped after {page.number} of {doc.page_count} pages")
+                truncated = True
+                break
+            width = page.rect.width
+            raw = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP)
+            lines = [line for block in raw.get("blocks", []) if block.get("type") == 0
+                     for line in _line_records(block)]
+            columns = _order_lines(lines, width)
+            blocks = _group_blocks(lines)
+            pages.append({
+                "number": page.number + 1,
+                "width": round(width, 1),
+                "height": round(page.rect.height, 1),
+                "columns": columns,
+                "blocks": blocks,
+            })
+
+    text = "\n\n".join("\n".join(block["text"] for block in page["blocks"]) for page in pages)
+    layout = {"key": key, "pages": pages, "text": text.strip(), "truncated": truncated}
+
+    if not truncated:
+        _remember(key, layout)
+        if cache_path:
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(layout, f, ensure_ascii=False)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                print(f"Layout cache not written: {str(e)}", file=sys.stderr)
+    return layout
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract PDF text in reading order with layout metadata')
+    parser.add_argument('file_path', help='Path to a PDF file')
+    parser.add_argument('--blocks', action='store_true', help='Output the full block layout instead of text')
+
+    args = parser.parse_args()
+
+    layout = extract_layout(args.file_path)
+    if args.blocks:
+        print(json.dumps(layout, indent=2, ensure_ascii=False))
+    else:
+        print(layout["text"])
+
+
+if __name__ == "__main__":
+    main()
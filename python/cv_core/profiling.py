@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+CV Job Profiling
+On-demand cProfile and tracemalloc reports for individual parse jobs
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import pstats
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_PROFILE_DIR = "profiles"
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+
+class JobProfiler:
+    """Profiles the stages of one parse job.
+
+    Wrap each stage in ``with profiler.stage("name"):``. When the job was not
+    selected for profiling the context manager does nothing, so the hooks can
+    stay in the production path. For a profiled job each stage gets its own
+    cProfile run and a tracemalloc snapshot diff, written under
+    ``<output_dir>/<job_id>/`` as ``<stage>.prof`` (load with pstats or
+    snakeviz), ``<stage>.txt`` and ``<stage>.alloc.txt``, plus a
+    ``summary.json`` with wall time and memory per stage from ``finish()``.
+    """
+
+    def __init__(self, enabled: bool = False, job_id: str = "", output_dir: str = DEFAULT_PROFILE_DIR):
+        self.enabled = enabled
+        self.job_id = job_id or datetime.now().strftime("%Y%m%d-%H%M%S-") + f"{os.getpid()}"
+        self.output_dir = os.path.join(output_dir, self.job_id)
+        self.stages: List[Dict[str, Any]] = []
+        self._active = False
+        self._started_tracemalloc = False
+
+    @classmethod
+    def from_options(cls, job_name: str, profile: bool = False, sample_every: Optional[int] = None,
+                     output_dir: Optional[str] = None) -> "JobProfiler":
+        """Build a profiler from CLI options, falling back to the environment.
+
+        CV_PROFILE=1 turns profiling on for worker processes started without
+        ``--profile``; CV_PROFILE_SAMPLE=N profiles roughly one job in N and
+        CV_PROFILE_DIR sets where reports go.
+        """
+        if not profile:
+            profile = os.getenv("CV_PROFILE", "").lower() in ("1", "true", "yes")
+        if sample_every is None:
+            try:
+                sample_every = parse_sample_every(os.getenv("CV_PROFILE_SAMPLE") or "1")
+            except ValueError as e:
+                # A bad environment value must not fail every job
+                print(f"Ignoring CV_PROFILE_SAMPLE: {str(e)}", file=sys.stderr)
+                sample_every = 1
+        output_dir = output_dir or os.getenv("CV_PROFILE_DIR", DEFAULT_PROFILE_DIR)
+
+        # Every job is its own process, so sample randomly rather than by counter
+        enabled = profile and (sample_every <= 1 or random.randrange(sample_every) == 0)
+        safe_name = "".join(c if c.isalnum() or c in "-_." else "_" for c in os.path.basename(job_name))[:60]
+        job_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{safe_name}"
+        return cls(enabled=enabled, job_id=job_id, output_dir=output_dir)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Profile one stage; nested stages are folded into the outer one"""
+        if not self.enabled or self._active:
+            yield
+            return
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+            self._started_tracemalloc = True
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        profile = cProfile.Profile()
+        self._active = True
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - started
+            self._active = False
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            try:
+                self._write_stage(name, profile, before, after)
+            except OSError as e:
+                print(f"Profile for stage {name} not written: {str(e)}", file=sys.stderr)
+            self.stages.append({
+                "stage": name,
+                "wall_ms": round(elapsed * 1000, 1),
+                "traced_current_kb": round(current / 1024, 1),
+                "traced_peak_kb": round(peak / 1024, 1),
+            })
+
+    def _write_stage(self, name: str, profile: cProfile.Profile,
+                     before: tracemalloc.Snapshot, after: tracemalloc.Snapshot):
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, name)
+        profile.dump_stats(f"{base}.prof")
+
+        with open(f"{base}.txt", "w", encoding="utf-8") as f:
+            stats = pstats.Stats(profile, stream=f)
+            stats.sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+
+        # Ignore allocations made by the profilers themselves
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        with open(f"{base}.alloc.txt", "w", encoding="utf-8") as f:
+            f.write(f"Top {TOP_ALLOCATIONS} allocation changes during stage '{name}'\n\n")
+            for entry in diff[:TOP_ALLOCATIONS]:
+                f.write(f"{entry}\n")
+
+    def finish(self) -> Optional[str]:
+        """Write the job summary and stop tracing; returns the report directory"""
+        if not self.enabled:
+            return None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(os.path.join(self.output_dir, "summary.json"), "w", encoding="utf-8") as f:
+                json.dump({"job_id": self.job_id, "stages": self.stages}, f, indent=2)
+        except OSError as e:
+            print(f"Profile summary not written: {str(e)}", file=sys.stderr)
+            return None
+        return self.output_dir
+
+
+def disabled() -> JobProfiler:
+    """A profiler whose stages are no-ops"""
+    return JobProfiler(enabled=False)
+
+
+def parse_sample_every(value: str) -> int:
+    """Parse a 1-in-N sampling rate, raising ValueError with a readable message"""
+    try:
+        sample_every = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"--profile-sample expects a whole number, got {value!r}") from None
+    if sample_every < 1:
+        raise ValueError(f"--profile-sample must be at least 1, got {sample_every}")
+    return sample_every
+
+
+def pop_cli_options(argv: List[str]) -> Dict[str, Any]:
+    """Remove --profile options from a positional-style argv in place.
+
+    Supports ``--profile``, ``--profile-sample N`` and ``--profile-dir DIR``
+    (also in ``--opt=value`` form) for scripts that read sys.argv directly.
+    ``--profile-sample`` implies ``--profile``. Raises ValueError for a
+    missing or malformed value so the caller can report it.
+    """
+    options: Dict[str, Any] = {"profile": False, "sample_every": None, "output_dir": None}
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        key, _, inline = arg.partition("=")
+        if key == "--profile":
+            options["profile"] = True
+            argv.pop(index)
+        elif key in ("--profile-sample", "--profile-dir"):
+            argv.pop(index)
+            value = inline or (argv.pop(index) if index < len(argv) else "")
+            if not value:
+                raise ValueError(f"{key} expects a value")
+            if key == "--profile-sample":
+                options["profile"] = True
+                options["sample_every"] = parse_sample_every(value)
+            else:
+                options["output_dir"] = value
+        else:
+            index += 1
+    return options
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+CV LLM Providers
+Registry of chat-completion providers sharing one pool of API clients
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from openai import OpenAI
+from dotenv import load_dotenv
+
+from .deadline import Deadline, unbounded
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_PROVIDER = "openai"
+
+_clients: Dict[Tuple[Optional[str], Optional[str]], OpenAI] = {}
+_clients_lock = threading.Lock()
+
+
+def shared_client(api_key: Optional[str] = None, base_url: Optional[str] = None) -> OpenAI:
+    """Return the process-wide client for these credentials.
+
+    Clients hold an HTTP connection pool, so every parser, extractor and
+    provider in the process reuses one per (api_key, base_url) instead of
+    opening its own.
+    """
+    key = (api_key, base_url)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = OpenAI(api_key=api_key, base_url=base_url)
+        return client
+
+
+class OpenAIProvider:
+    """Chat completions through the OpenAI API (or a compatible base_url)"""
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url or os.getenv("OPENAI_BASE_URL")
+
+    @property
+    def client(self) -> OpenAI:
+        # Resolved per call: missing credentials fail the model tier, not construction
+        return shared_client(self.api_key, self.base_url)
+
+    def complete(self, model: str, messages: List[Dict[str, str]], deadline: Optional[Deadline] = None,
+                 stage: str = "completion", **params: Any) -> str:
+        """Run one chat completion and return the message content"""
+        deadline = deadline or unbounded()
+        response = deadline.client(self.client, stage).chat.completions.create(
+            model=model,
+            messages=messages,
+            **params
+        )
+        return response.choices[0].message.content
+
+
+# factory(**options) -> provider with a ``complete`` method
+_PROVIDERS: Dict[str, Callable[..., Any]] = {}
+
+
+def register_provider(name: str, factory: Callable[..., Any]):
+    """Register an LLM provider factory under a name"""
+    _PROVIDERS[name] = factory
+
+
+def get_provider(name: Optional[str] = None, **options: Any) -> Any:
+    """Build the named provider, defaulting to CV_LLM_PROVIDER"""
+    name = name or os.getenv("CV_LLM_PROVIDER", DEFAULT_PROVIDER)
+    factory = _PROVIDERS.get(name)
+    if factory is None:
+        raise ValueError(f"Unknown LLM provider: {name} (registered: {', '.join(sorted(_PROVIDERS))})")
+    return factory(**options)
+
+
+register_provider("openai", OpenAIProvider)
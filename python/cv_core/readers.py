@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+CV Format Readers
+Registry of file readers that turn an uploaded CV into plain text
+"""
+
+import os
+from typing import Callable, Dict, Iterable, List, Optional
+
+import fitz  # PyMuPDF
+import docx  # python-docx
+
+from . import layout
+from .deadline import Deadline, unbounded
+
+# reader(file_path, deadline, pdf_mode) -> text
+Reader = Callable[[str, Deadline, str], str]
+
+_READERS: Dict[str, Reader] = {}
+
+
+def register_reader(extensions: Iterable[str], reader: Reader):
+    """Register a reader for one or more file extensions, e.g. [".pdf"]"""
+    for extension in extensions:
+        _READERS[extension.lower()] = reader
+
+
+def supported_extensions() -> List[str]:
+    return sorted(_READERS)
+
+
+def read_text(file_path: str, deadline: Optional[Deadline] = None, pdf_mode: Optional[str] = None) -> str:
+    """Extract text from a CV file with the reader registered for its extension"""
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    file_ext = os.path.splitext(file_path)[1].lower()
+    reader = _READERS.get(file_ext)
+    if reader is None:
+        raise ValueError(f"Unsupported file format: {file_ext}")
+    return reader(file_path, deadline or unbounded(), pdf_mode or layout.pdf_mode()).strip()
+
+
+def read_pdf(file_path: str, deadline: Deadline, pdf_mode: str) -> str:
+    """Extract text from PDF file using PyMuPDF"""
+    try:
+        if pdf_mode == "layout":
+            # Reading-order text; block layout stays cached for later stages
+            return layout.extract_layout(file_path, deadline)["text"]
+        pages = []
+        with fitz.open(file_path) as doc:
+            for page in doc:
+                # Keep the pages we have rather than lose the whole job
+                if page.number > 0 and deadline.expired():
+                    deadline.note(f"text_extraction: stopped after {page.number} of {doc.page_count} pages")
+                    break
+                pages.append(page.get_text())
+        # get_text() ends every page with a newline already
+        return "".join(pages)
+    except Exception as e:
+        raise Exception(f"Error extracting PDF: {str(e)}")
+
+
+def read_docx(file_path: str, deadline: Deadline, pdf_mode: str) -> str:
+    """Extract text from DOCX file"""
+    try:
+        doc = docx.Document(file_path)
+        return "\n".join(paragraph.text for paragraph in doc.paragraphs)
+    except Exception as e:
+        if file_path.lower().endswith(".doc"):
+            raise Exception(f"Error extracting DOC (legacy Word files must be saved as .docx): {str(e)}")
+        raise Exception(f"Error extracting DOCX: {str(e)}")
+
+
+def read_txt(file_path: str, deadline: Deadline, pdf_mode: str) -> str:
+    """Extract text from TXT file"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read()
+    except Exception as e:
+        raise Exception(f"Error extracting TXT: {str(e)}")
+
+
+register_reader([".pdf"], read_pdf)
+register_reader([".docx", ".doc"], read_docx)
+register_reader([".txt"], read_txt)
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+CV Schema
+The structured CV schema, its compiled validator, and adapters to the
+cv_parser.py and cv_extractor.py output shapes
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+Validator = Callable[[Any, str], List[str]]
+
+
+class Nullable:
+    """Schema node that also accepts null"""
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+
+class Omittable:
+    """Schema node for a dict key that may be absent"""
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+
+class ListOf:
+    """Schema node for a list whose items all match one spec"""
+    def __init__(self, spec: Any):
+        self.spec = spec
+
+
+class AnyOf:
+    """Schema node that accepts a value matching any of several specs"""
+    def __init__(self, *specs: Any):
+        self.specs = specs
+
+
+def _type_name(value: Any) -> str:
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def compile_schema(spec: Any) -> Validator:
+    """Compile a schema spec into a validator function.
+
+    The spec is walked once here so validating a response is just a chain of
+    closure calls. The returned function takes ``(value, path)`` and returns a
+    list of ``"path: message"`` errors; an empty list means the value is valid.
+    """
+    if isinstance(spec, Nullable):
+        inner = compile_schema(spec.spec)
+
+        def validate_nullable(value: Any, path: str) -> List[str]:
+            return [] if value is None else inner(value, path)
+        return validate_nullable
+
+    if isinstance(spec, ListOf):
+        item = compile_schema(spec.spec)
+
+        def validate_list(value: Any, path: str) -> List[str]:
+            if not isinstance(value, list):
+                return [f"{path}: expected list, got {_type_name(value)}"]
+            errors: List[str] = []
+            for index, entry in enumerate(value):
+                errors.extend(item(entry, f"{path}[{index}]"))
+            return errors
+        return validate_list
+
+    if isinstance(spec, AnyOf):
+        options = [compile_schema(option) for option in spec.specs]
+
+        def validate_any(value: Any, path: str) -> List[str]:
+            first_errors: List[str] = []
+            for option in options:
+                errors = option(value, path)
+                if not errors:
+                    return []
+                first_errors = first_errors or errors
+            return first_errors
+        return validate_any
+
+    if isinstance(spec, dict):
+        fields: List[Tuple[str, bool, Validator]] = []
+        for key, field_spec in spec.items():
+            required = not isinstance(field_spec, Omittable)
+            if not required:
+                field_spec = field_spec.spec
+            fields.append((key, required, compile_schema(field_spec)))
+
+        def validate_dict(value: Any, path: str) -> List[str]:
+            if not isinstance(value, dict):
+                return [f"{path}: expected object, got {_type_name(value)}"]
+            errors: List[str] = []
+            for key, required, field in fields:
+                if key in value:
+                    errors.extend(field(value[key], f"{path}.{key}"))
+                elif required:
+                    errors.append(f"{path}.{key}: missing")
+            return errors
+        return validate_dict
+
+    if isinstance(spec, type) or (isinstance(spec, tuple) and all(isinstance(t, type) for t in spec)):
+        expected = spec.__name__ if isinstance(spec, type) else "/".join(t.__name__ for t in spec)
+
+        def validate_type(value: Any, path: str) -> List[str]:
+            # bool is an int subclass; never let it satisfy a numeric field
+            if isinstance(value, bool) and spec is not bool:
+                return [f"{path}: expected {expected}, got bool"]
+            if not isinstance(value, spec):
+                return [f"{path}: expected {expected}, got {_type_name(value)}"]
+            return []
+        return validate_type
+
+    raise TypeError(f"Unsupported schema node: {spec!r}")
+
+
+Text = Nullable(str)
+TextList = Nullable(ListOf(Nullable(str)))
+
+# The one structured CV shape every extraction tier produces. The adapters
+# below map it onto the output shapes of cv_parser.py and cv_extractor.py.
+CV_SCHEMA = {
+    "personal_info": {
+        "name": Text,
+        "email": Omittable(Text),
+        "phone": Omittable(Text),
+        "location": Omittable(Text),
+        "linkedin": Omittable(Text),
+        "github": Omittable(Text),
+        "website": Omittable(Text),
+        "portfolio": Omittable(Text),
+        "other_urls": Omittable(TextList),
+    },
+    "tagline": Omittable(Text),
+    "professional_summary": Text,
+    "work_experience": Nullable(ListOf({
+        "title": Text,
+        "company": Text,
+        "location": Omittable(Text),
+        "start_date": Omittable(Text),
+        "end_date": Omittable(Text),
+        "duration": Omittable(Text),
+        "description": Omittable(Text),
+        "achievements": Omittable(TextList),
+        "technologies": Omittable(TextList),
+    })),
+    "education": Nullable(ListOf({
+        "degree": Text,
+        "institution": Text,
+        "location": Omittable(Text),
+        "start_date": Omittable(Text),
+        "end_date": Omittable(Text),
+        "gpa": Omittable(Text),
+        "notes": Omittable(Text),
+        "relevant_courses": Omittable(TextList),
+    })),
+    "skills": Nullable({
+        "technical": Omittable(TextList),
+        "programming": Omittable(TextList),
+        "tools": Omittable(TextList),
+        "soft_skills": Omittable(TextList),
+    }),
+    "certifications": Omittable(Nullable(ListOf({
+        "name": Text,
+        "issuer": Omittable(Text),
+        "date": Omittable(Text),
+        "expiry": Omittable(Text),
+        "credential_id": Omittable(Text),
+    }))),
+    "languages": Omittable(Nullable(ListOf({
+        "language": Text,
+        "proficiency": Omittable(Text),
+    }))),
+    "projects": Omittable(Nullable(ListOf({
+        "name": Text,
+        "description": Omittable(Text),
+        "technologies": Omittable(TextList),
+        "url": Omittable(Text),
+        "date": Omittable(Text),
+    }))),
+    "achievements": Omittable(Nullable(ListOf(AnyOf(str, {
+        "title": Text,
+        "description": Omittable(Text),
+        "date": Omittable(Text),
+    })))),
+    "interests": Omittable(TextList),
+}
+
+_validate_cv = compile_schema(CV_SCHEMA)
+
+
+def validate(data: Any) -> List[str]:
+    """Validate data against the structured CV schema"""
+    return _validate_cv(data, "$")
+
+
+def is_usable(data: Any) -> bool:
+    """Whether an invalid CV still has the containers the adapters read from.
+
+    Used to pick an unaccepted fallback: a candidate whose top level,
+    ``personal_info`` or ``skills`` has the wrong type carries nothing the
+    adapters could keep.
+    """
+    return isinstance(data, dict) and isinstance(data.get("personal_info"), dict) and \
+        isinstance(data.get("skills"), (dict, type(None)))
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _text(value: Any) -> str:
+    return value if isinstance(value, str) else ""
+
+
+def _texts(values: Any) -> List[str]:
+    return [v for v in values if isinstance(v, str) and v.strip()] if isinstance(values, list) else []
+
+
+def _entries(values: Any) -> List[Dict[str, Any]]:
+    return [v for v in values if isinstance(v, dict)] if isinstance(values, list) else []
+
+
+def _items(values: Any) -> List[Any]:
+    return values if isinstance(values, list) else []
+
+
+def _achievement_text(entry: Any) -> str:
+    if isinstance(entry, str):
+        return entry
+    title = _text(entry.get("title"))
+    description = _text(entry.get("description"))
+    return f"{title}: {description}" if title and description else title or description
+
+
+def to_parser_result(cv: Dict[str, Any]) -> Dict[str, Any]:
+    """Adapt a structured CV to the shape cv_parser.py stores and displays"""
+    cv = _mapping(cv)
+    personal = _mapping(cv.get("personal_info"))
+    skills = _mapping(cv.get("skills"))
+
+    # Combine skills and tools into a single skills array with levels
+    all_skills = []
+    for skill in _texts(skills.get("technical")) + _texts(skills.get("programming")) + _texts(skills.get("soft_skills")):
+        all_skills.append({
+            "name": skill,
+            "level": 70 + len(all_skills) * 3  # Assign varied levels
+        })
+    for tool in _texts(skills.get("tools")):
+        all_skills.append({
+            "name": tool,
+            "level": 80 + len(all_skills) * 2  # Assign varied levels for tools
+        })
+
+    return {
+        "personal_info": {
+            "name": _text(personal.get("name")),
+            "email": _text(personal.get("email")),
+            "phone": _text(personal.get("phone")),
+            "address": _text(personal.get("location")),
+            "linkedin": _text(personal.get("linkedin")),
+            "github": _text(personal.get("github")),
+            "website": _text(personal.get("website")),
+            "portfolio": _text(personal.get("portfolio")),
+            "other_urls": _texts(personal.get("other_urls"))
+        },
+        "professional_summary": _text(cv.get("professional_summary")),
+        "work_experience": [{
+            "title": _text(exp.get("title")),
+            "company": _text(exp.get("company")),
+            "start_date": _text(exp.get("start_date")),
+            "end_date": _text(exp.get("end_date")),
+            "description": _text(exp.get("description"))
+        } for exp in _entries(cv.get("work_experience"))],
+        "education": [{
+            "degree": _text(edu.get("degree")),
+            "institution": _text(edu.get("institution")),
+            "start_date": _text(edu.get("start_date")),
+            "end_date": _text(edu.get("end_date")),
+            "description": _text(edu.get("notes"))
+        } for edu in _entries(cv.get("education"))],
+        "skills": all_skills,  # Combined skills and tools with levels
+        "certifications": [],  # Not in the parser format, can be added later
+        "languages": [],  # Not in the parser format, can be added later
+        "achievements": [text for text in (_achievement_text(a) for a in _items(cv.get("achievements"))
+                                           if isinstance(a, (str, dict))) if text],
+        "interests": _texts(cv.get("interests")),
+        "tagline": _text(cv.get("tagline"))
+    }
+
+
+def to_extractor_result(cv: Dict[str, Any]) -> Dict[str, Any]:
+    """Adapt a structured CV to the shape cv_extractor.py returns"""
+    cv = _mapping(cv)
+    personal = _mapping(cv.get("personal_info"))
+    skills = _mapping(cv.get("skills"))
+    return {
+        "personal_info": {
+            "name": personal.get("name") or None,
+            "email": personal.get("email") or None,
+            "phone": personal.get("phone") or None,
+            "location": personal.get("location") or None,
+            "linkedin": personal.get("linkedin") or None,
+            "website": personal.get("website") or None
+        },
+        "professional_summary": cv.get("professional_summary") or None,
+        "work_experience": [{
+            "title": exp.get("title"),
+            "company": exp.get("company"),
+            "location": exp.get("location"),
+            "start_date": exp.get("start_date"),
+            "end_date": exp.get("end_date"),
+            "duration": exp.get("duration"),
+            "description": exp.get("description"),
+            "achievements": _texts(exp.get("achievements")),
+            "technologies": _texts(exp.get("technologies"))
+        } for exp in _entries(cv.get("work_experience"))],
+        "education": [{
+            "degree": edu.get("degree"),
+            "institution": edu.get("institution"),
+            "location": edu.get("location"),
+            "graduation_date": edu.get("end_date"),
+            "gpa": edu.get("gpa"),
+            "relevant_courses": _texts(edu.get("relevant_courses"))
+        } for edu in _entries(cv.get("education"))],
+        "skills": {
+            "technical": _texts(skills.get("technical")),
+            "programming": _texts(skills.get("programming")),
+            "tools": _texts(skills.get("tools")),
+            "soft_skills": _texts(skills.get("soft_skills"))
+        },
+        "certifications": _entries(cv.get("certifications")),
+        "languages": _entries(cv.get("languages")),
+        "projects": _entries(cv.get("projects")),
+        "achievements": [
+            {"title": a, "description": None, "date": None} if isinstance(a, str) else a
+            for a in _items(cv.get("achievements")) if isinstance(a, (str, dict))
+        ]
+    }
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+CV Parity Check
+Runs the sample corpus through cv_parser.py and cv_extractor.py and reports
+any file where their text differs from the pre-cv_core readers or where their
+structured output disagrees
+"""
+
+import os
+import sys
+import glob
+import json
+import argparse
+import tempfile
+import textwrap
+from typing import Any, Dict, List, Optional
+
+import fitz  # PyMuPDF
+import docx  # python-docx
+from dotenv import load_dotenv
+
+from cv_core import heuristics, register_provider
+from cv_extractor import CVExtractor
+from cv_parser import CVParser
+
+# Load environment variables
+load_dotenv()
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CORPUS = [
+    os.path.join(REPO_ROOT, "test", "data", "*"),
+    os.path.join(REPO_ROOT, "public", "*cv*.txt"),
+]
+
+STUB_PROVIDER = "parity-stub"
+STUB_MODEL = "parity-model"
+LINES_PER_PAGE = 60
+
+
+class StubProvider:
+    """Offline provider: answers with the local heuristics as fenced JSON.
+
+    Registered in place of OpenAI so both wrappers run their full model path
+    (prompt, provider call, JSON recovery, validation, adapter) without
+    credentials or network.
+    """
+
+    def __init__(self, **options: Any):
+        self.calls = 0
+
+    def complete(self, model: str, messages: List[Dict[str, str]], deadline: Any = None,
+                 stage: str = "completion", **params: Any) -> str:
+        self.calls += 1
+        cv_text = messages[-1]["content"].split("\n\n", 1)[-1]
+        data, _ = heuristics.extract(cv_text)
+        return f"```json\n{json.dumps(data, ensure_ascii=False)}\n```"
+
+
+def legacy_text(file_path: str) -> str:
+    """Text as the pre-cv_core CVParser readers produced it (plain PDF mode)"""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    if file_ext == '.pdf':
+        doc = fitz.open(file_path)
+        text = ""
+        for page in doc:
+            text += page.get_text()
+        doc.close()
+        return text.strip()
+    elif file_ext == '.docx':
+        doc = docx.Document(file_path)
+        text = ""
+        for paragraph in doc.paragraphs:
+            text += paragraph.text + "\n"
+        return text.strip()
+    elif file_ext == '.txt':
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.read().strip()
+    raise Exception(f"Unsupported file format: {file_ext}")
+
+
+def generate_samples(text: str, directory: str) -> List[str]:
+    """Write a multi-page PDF and a DOCX of a sample CV so every reader is covered"""
+    lines = [wrapped for line in text.split("\n") for wrapped in textwrap.wrap(line, 90) or [""]]
+    pdf_path = os.path.join(directory, "generated-cv.pdf")
+    with fitz.open() as doc:
+        for first in range(0, len(lines), LINES_PER_PAGE):
+            page = doc.new_page()
+            for index, line in enumerate(lines[first:first + LINES_PER_PAGE]):
+                page.insert_text((50, 60 + index * 12), line, fontsize=9)
+        doc.save(pdf_path)
+
+    docx_path = os.path.join(directory, "generated-cv.docx")
+    document = docx.Document()
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    document.save(docx_path)
+    return [pdf_path, docx_path]
+
+
+def _names(values: Any) -> List[str]:
+    return [value["name"] if isinstance(value, dict) else value for value in values or []]
+
+
+def _parser_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    personal = result["personal_info"]
+    cascade = result.get("cascade") or {}
+    return {
+        "tier": cascade.get("tier") or cascade.get("fallback_tier"),
+        "accepted": cascade.get("accepted"),
+        "name": personal.get("name") or None,
+        "email": personal.get("email") or None,
+        "phone": personal.get("phone") or None,
+        "location": personal.get("address") or None,
+        "linkedin": personal.get("linkedin") or None,
+        "summary": result["professional_summary"] or None,
+        "experience": [(e["title"], e["company"], e["start_date"], e["end_date"]) for e in result["work_experience"]],
+        "education": [(e["degree"], e["institution"], e["end_date"]) for e in result["education"]],
+        "skills": sorted(_names(result["skills"])),
+    }
+
+
+def _extractor_fields(result: Dict[str, Any]) -> Dict[str, Any]:
+    personal = result["personal_info"]
+    skills = result["skills"]
+    cascade = result["_metadata"]["cascade"]
+    return {
+        "tier": result["_metadata"]["model"],
+        "accepted": cascade.get("accepted"),
+        "name": personal["name"] or None,
+        "email": personal["email"] or None,
+        "phone": personal["phone"] or None,
+        "location": personal["location"] or None,
+        "linkedin": personal["linkedin"] or None,
+        "summary": result["professional_summary"] or None,
+        "experience": [(e["title"] or "", e["company"] or "", e["start_date"] or "", e["end_date"] or "")
+                       for e in result["work_experience"]],
+        "education": [(e["degree"] or "", e["institution"] or "", e["graduation_date"] or "")
+                      for e in result["education"]],
+        "skills": sorted(skills["technical"] + skills["programming"] + skills["soft_skills"] + skills["tools"]),
+    }
+
+
+def _read(reader: Any, file_path: str) -> Any:
+    try:
+        return reader(file_path)
+    except Exception as e:
+        return e
+
+
+def check_file(file_path: str, parser: CVParser, extractor: CVExtractor, pin_text: bool,
+               expected_tier: Optional[str]) -> Dict[str, Any]:
+    """Compare both tools' text and structured output for one file"""
+    texts = {
+        "legacy": _read(legacy_text, file_path) if pin_text else None,
+        "parser": _read(parser.extract_text, file_path),
+        "extractor": _read(extractor.extract_text_from_file, file_path),
+    }
+    read = {source: text if isinstance(text, Exception) or text.strip() else Exception("No text extracted")
+            for source, text in texts.items() if text is not None}
+    if all(isinstance(text, Exception) for text in read.values()):
+        return {"file": file_path, "status": "skipped", "reason": str(read["parser"])}
+
+    differences: Dict[str, Any] = {}
+    failed = [source for source, text in read.items() if isinstance(text, Exception)]
+    if failed:
+        differences["text"] = {source: str(read[source]) for source in failed}
+        return {"file": file_path, "status": "mismatch", "differences": differences}
+    reference = read.get("legacy", read["parser"])
+    for source in ("parser", "extractor"):
+        if read[source] != reference:
+            differences[f"text_{source}"] = {"expected_length": len(reference), "length": len(read[source])}
+
+    # Both public structured-extraction methods, end to end
+    parser_fields = _parser_fields(parser.extract_structured_data(read["parser"]))
+    extractor_fields = _extractor_fields(
+        extractor.extract_structured_content(read["extractor"], os.path.basename(file_path)))
+    for field, value in parser_fields.items():
+        if extractor_fields[field] != value:
+            differences[field] = {"parser": value, "extractor": extractor_fields[field]}
+    if expected_tier and parser_fields["tier"] != expected_tier:
+        differences["provider"] = {"expected_tier": expected_tier, "parser_tier": parser_fields["tier"]}
+
+    return {"file": file_path, "status": "mismatch" if differences else "ok", "differences": differences}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check cv_parser.py and cv_extractor.py agree on a CV corpus')
+    parser.add_argument('files', nargs='*',
+                        help='CV files (defaults to test/data, public/*cv*.txt and a generated PDF/DOCX)')
+    parser.add_argument('--live', action='store_true',
+                        help='Use the configured provider and cascade instead of the offline stub')
+    parser.add_argument('--pdf-mode', choices=['plain', 'layout'],
+                        help='PDF text extraction mode for both tools (layout is not pinned to the old readers)')
+
+    args = parser.parse_args()
+    expected_tier = None
+    if not args.live:
+        # Every structured call goes through the stub provider; nothing is logged
+        register_provider(STUB_PROVIDER, StubProvider)
+        os.environ["CV_LLM_PROVIDER"] = STUB_PROVIDER
+        os.environ["CV_CASCADE_TIERS"] = STUB_MODEL
+        os.environ.pop("CV_CASCADE_STATS_FILE", None)
+        expected_tier = STUB_MODEL
+
+    with tempfile.TemporaryDirectory() as directory:
+        files = args.files
+        if not files:
+            files = sorted(path for pattern in DEFAULT_CORPUS for path in glob.glob(pattern))
+            sample = next((path for path in files if path.endswith(".txt")), None)
+            if sample:
+                files += generate_samples(legacy_text(sample), directory)
+        if not files:
+            parser.error('No CV files found')
+
+        cv_parser = CVParser(pdf_mode=args.pdf_mode or "plain")
+        cv_extractor = CVExtractor(pdf_mode=args.pdf_mode or "plain")
+        pin_text = args.pdf_mode != "layout"
+        results = [check_file(path, cv_parser, cv_extractor, pin_text, expected_tier) for path in files]
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+    mismatches = [r for r in results if r["status"] == "mismatch"]
+    print(f"{len(results) - len(mismatches)}/{len(results)} files consistent", file=sys.stderr)
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
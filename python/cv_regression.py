@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+CV Regression Checks
+Known-bad inputs for the local extraction paths; exits non-zero on any failure
+"""
+
+import os
+import sys
+import tempfile
+from typing import Callable, List, Optional
+
+import fitz  # PyMuPDF
+
+from cv_core import heuristics, layout
+from cv_core.cascade import DEFAULT_MIN_CONFIDENCE, HEURISTIC_TIER, ModelCascade
+from cv_core.extraction import decode_json
+from cv_core.schema import is_usable, to_extractor_result, to_parser_result, validate
+
+COMPANY_FIRST_CV = """Jane Doe
+jane.doe@example.com
+
+Experience
+Acme Bank
+Senior Product Manager
+Jan 2019 - Present
+Beta Ltd, London
+Product Owner
+2015 - 2018
+
+Skills
+SQL, Roadmapping
+"""
+
+
+def check_company_first_headings() -> Optional[str]:
+    """Company-first headings must not be accepted with title and company swapped"""
+    data, confidence = heuristics.extract(COMPANY_FIRST_CV)
+    roles = [(e["title"], e["company"]) for e in data["work_experience"]]
+    if roles != [("Senior Product Manager", "Acme Bank"), ("Product Owner", "Beta Ltd")]:
+        return f"unexpected roles {roles}"
+    # "Beta Ltd, London" over "Product Owner" is ambiguous: leave it to the model
+    if confidence >= DEFAULT_MIN_CONFIDENCE:
+        return f"ambiguous headings scored {confidence}"
+    return None
+
+
+def check_model_outage_keeps_heuristics() -> Optional[str]:
+    """A failing model tier must fall back to the heuristic result, not None"""
+    def call_model(model: str, text: str) -> str:
+        raise ConnectionError("model unavailable")
+
+    cascade = ModelCascade("cv", validate, heuristic=heuristics.extract,
+                           tiers=[HEURISTIC_TIER, "gpt-4.1-mini"], stats_path="")
+    data, report = cascade.run(COMPANY_FIRST_CV, call_model)
+    if data is None or report["accepted"] or report["fallback_tier"] != HEURISTIC_TIER:
+        return f"got {'no data' if data is None else 'data'} with report {report}"
+    return None
+
+
+def check_wrong_typed_model_answer_keeps_heuristics() -> Optional[str]:
+    """A model answer with the wrong container types must not displace the heuristic result"""
+    answers = {
+        "gpt-4.1-mini": '{"personal_info": {"name": "Jane Doe"}, "skills": ["Python", "Go"]}',
+        "gpt-4.1": '[{"name": "Jane Doe"}]',
+    }
+
+    def call_model(model: str, text: str) -> str:
+        return answers[model]
+
+    cascade = ModelCascade("cv", validate, heuristic=heuristics.extract, tiers=[HEURISTIC_TIER, *answers],
+                           stats_path="", usable=is_usable)
+    data, report = cascade.run(COMPANY_FIRST_CV, call_model, decode=decode_json)
+    if report["accepted"] or report["fallback_tier"] != HEURISTIC_TIER:
+        return f"fell back to {report['fallback_tier']}"
+    for answer in answers.values():
+        for adapt in (to_parser_result, to_extractor_result):
+            adapt(decode_json(answer))
+    if to_parser_result(data)["personal_info"]["name"] != "Jane Doe":
+        return f"lost the heuristic result: {data}"
+    return None
+
+
+# Sidebar templates: a narrow column of short entries beside a main column
+# about 60% of an A4 page wide, whose long lines must not be read as
+# spanning both; the sidebar is on the left or, in small type, on the right
+SIDEBAR_HEADER = "Jane Example  -  Senior Product Manager  -  jane@example.com  -  London, United Kingdom"
+SIDEBAR_LINES = ["SKILLS", "Kubernetes", "Python", "Roadmaps", "CONTACT", "+44 7000 000000", "LANGUAGES", "English"]
+MAIN_LINES = [
+    "EXPERIENCE",
+    "Product Manager at Acme Corp",
+    "Led the roadmap for the platform team delivering features to many customers",
+    "Owned discovery and delivery for the payments and subscriptions experience area",
+    "Senior Analyst at Beta Ltd",
+    "Built dashboards and models used by the executive leadership team every week",
+]
+
+
+def _sidebar_pdf(path: str, sidebar_x: float, main_x: float, sidebar_size: float):
+    with fitz.open() as doc:
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((40, 60), SIDEBAR_HEADER, fontsize=12)
+        for index, text in enumerate(SIDEBAR_LINES):
+            page.insert_text((sidebar_x, 110 + index * 18), text, fontsize=sidebar_size)
+        for index, text in enumerate(MAIN_LINES):
+            page.insert_text((main_x, 110 + index * 18), text, fontsize=10)
+        doc.save(path)
+
+
+def _sidebar_reading_order(sidebar_x: float, main_x: float, sidebar_size: float) -> Optional[str]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sidebar.pdf")
+        _sidebar_pdf(path, sidebar_x, main_x, sidebar_size)
+        text_lines = [line for line in layout.extract_layout(path)["text"].split("\n") if line.strip()]
+    columns = [SIDEBAR_LINES, MAIN_LINES] if sidebar_x < main_x else [MAIN_LINES, SIDEBAR_LINES]
+    expected = [SIDEBAR_HEADER] + columns[0] + columns[1]
+    if text_lines != expected:
+        return f"read as {text_lines}"
+    return None
+
+
+def check_sidebar_reading_order() -> Optional[str]:
+    """Layout mode must read the sidebar and the main column as separate runs"""
+    return _sidebar_reading_order(sidebar_x=40, main_x=210, sidebar_size=10)
+
+
+def check_right_sidebar_reading_order() -> Optional[str]:
+    """A narrow right-hand sidebar on the main column's rows is a column, not cells"""
+    for sidebar_size in (9, 10):
+        problem = _sidebar_reading_order(sidebar_x=430, main_x=40, sidebar_size=sidebar_size)
+        if problem:
+            return f"at {sidebar_size}pt {problem}"
+    return None
+
+
+CHECKS: List[Callable[[], Optional[str]]] = [
+    check_company_first_headings,
+    check_model_outage_keeps_heuristics,
+    check_wrong_typed_model_answer_keeps_heuristics,
+    check_sidebar_reading_order,
+    check_right_sidebar_reading_order,
+]
+
+
+def main():
+    failures = 0
+    for check in CHECKS:
+        try:
+            problem = check()
+        except Exception as e:
+            problem = f"raised {type(e).__name__}: {str(e)}"
+        print(f"{'FAIL' if problem else 'ok'}  {check.__name__}{': ' + problem if problem else ''}")
+        failures += bool(problem)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+"""
+CV Result Store
+Persists parsed CVs in SQLite with inverted indexes for skill/title/company search
+"""
+
+import os
+import re
+import sys
+import json
+import sqlite3
+import hashlib
+import argparse
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+DEFAULT_DB_PATH = os.getenv("CV_STORE_PATH", "cv_store.db")
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cvs (
+    id INTEGER PRIMARY KEY,
+    doc_hash TEXT NOT NULL UNIQUE,
+    source_file TEXT,
+    name TEXT,
+    email TEXT,
+    total_months INTEGER NOT NULL DEFAULT 0,
+    open_start INTEGER,
+    analyzed_at TEXT,
+    stored_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cv_skills (
+    term TEXT NOT NULL,
+    cv_id INTEGER NOT NULL,
+    PRIMARY KEY (term, cv_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cv_titles (
+    term TEXT NOT NULL,
+    cv_id INTEGER NOT NULL,
+    months INTEGER NOT NULL DEFAULT 0,
+    open_start INTEGER,
+    PRIMARY KEY (term, cv_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cv_companies (
+    term TEXT NOT NULL,
+    cv_id INTEGER NOT NULL,
+    PRIMARY KEY (term, cv_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cv_roles (
+    cv_id INTEGER NOT NULL,
+    title TEXT,
+    company TEXT,
+    start_month INTEGER,
+    end_month INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_cv_skills_cv ON cv_skills (cv_id);
+CREATE INDEX IF NOT EXISTS idx_cv_titles_cv ON cv_titles (cv_id);
+CREATE INDEX IF NOT EXISTS idx_cv_companies_cv ON cv_companies (cv_id);
+CREATE INDEX IF NOT EXISTS idx_cv_roles_cv ON cv_roles (cv_id);
+CREATE INDEX IF NOT EXISTS idx_cv_roles_start ON cv_roles (start_month, cv_id);
+CREATE INDEX IF NOT EXISTS idx_cv_roles_end ON cv_roles (end_month, cv_id);
+CREATE INDEX IF NOT EXISTS idx_cvs_total_months ON cvs (total_months);
+CREATE INDEX IF NOT EXISTS idx_cvs_open_experience ON cvs (open_start - total_months) WHERE open_start IS NOT NULL;
+"""
+
+INDEX_TABLES = ("cv_skills", "cv_titles", "cv_companies", "cv_roles")
+
+# Common spellings folded onto one index term
+SKILL_ALIASES = {
+    "k8s": "kubernetes",
+    "js": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "postgres": "postgresql",
+    "golang": "go",
+    "amazon web services": "aws",
+    "gcp": "google cloud",
+    "ml": "machine learning",
+}
+
+# Seniority words dropped from titles so "Senior Product Manager" matches "Product Manager"
+TITLE_QUALIFIERS = {
+    "senior", "sr", "junior", "jr", "lead", "principal", "staff", "associate",
+    "interim", "acting", "contract", "contractor", "freelance", "remote", "i", "ii", "iii",
+}
+
+MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+PRESENT_WORDS = {"present", "current", "now", "today", "ongoing"}
+
+
+def normalize_term(value: str) -> str:
+    """Lowercase, trim and collapse whitespace"""
+    return re.sub(r"\s+", " ", value.strip().lower())
+
+
+def normalize_skill(value: str) -> str:
+    term = normalize_term(value).strip(" .,-")
+    return SKILL_ALIASES.get(term, term)
+
+
+def normalize_title(value: str) -> str:
+    # Drop bracketed notes like "(Contract)" and any seniority qualifiers
+    term = normalize_term(re.sub(r"\(.*?\)", " ", value))
+    words = [w for w in re.split(r"[\s/,]+", term) if w and w.strip(".") not in TITLE_QUALIFIERS]
+    return " ".join(words)
+
+
+def normalize_company(value: str) -> str:
+    term = normalize_term(value)
+    return re.sub(r"[,.]?\s+(ltd|limited|inc|llc|plc|gmbh|corp|corporation)\.?$", "", term)
+
+
+def is_open_ended(value: Any) -> bool:
+    """True for end dates like "Present" that mean the role is ongoing"""
+    return isinstance(value, str) and value.strip().lower() in PRESENT_WORDS
+
+
+def parse_month(value: Any, now_month: int, end: bool = False) -> Optional[int]:
+    """Parse a CV date into a month ordinal (year * 12 + month - 1).
+
+    A bare year is January as a start date and December with ``end``, so
+    "2019 - 2023" spans five whole years.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    text = value.strip().lower()
+    if text in PRESENT_WORDS:
+        return now_month
+    match = re.search(r"(\d{1,2})[/.-](\d{4})", text)
+    if match and 1 <= int(match.group(1)) <= 12:
+        return int(match.group(2)) * 12 + int(match.group(1)) - 1
+    match = re.search(r"([a-z]{3})[a-z]*\.?\s+(\d{4})", text)
+    if match and match.group(1) in MONTHS:
+        return int(match.group(2)) * 12 + MONTHS[match.group(1)] - 1
+    match = re.search(r"\b(\d{4})\b", text)
+    if match:
+        return int(match.group(1)) * 12 + (11 if end else 0)
+    return None
+
+
+def _month_label(month: Optional[int]) -> Optional[str]:
+    if month is None:
+        return None
+    return f"{month // 12:04d}-{month % 12 + 1:02d}"
+
+
+def _skill_names(data: Dict[str, Any]) -> List[str]:
+    """Collect skill names from either CVParser or CVExtractor output"""
+    names: List[str] = []
+    skills = data.get("skills") or []
+    if isinstance(skills, dict):
+        for group in skills.values():
+            names.extend(s for s in group or [] if isinstance(s, str))
+    else:
+        for skill in skills:
+            if isinstance(skill, dict):
+                skill = skill.get("name")
+            if isinstance(skill, str):
+                names.append(skill)
+    names.extend(t for t in data.get("tools") or [] if isinstance(t, str))
+    for role in data.get("work_experience") or []:
+        names.extend(t for t in (role or {}).get("technologies") or [] if isinstance(t, str))
+    return names
+
+
+def _closed_months(spans: List[Tuple[int, int]], open_start: Optional[int]) -> int:
+    """Months covered by closed spans, counting overlaps once.
+
+    Months from ``open_start`` onwards belong to an ongoing role and are
+    counted at query time, so spans are clipped before it.
+    """
+    total = 0
+    current_end = None
+    for start, end in sorted(spans):
+        if open_start is not None:
+            if start >= open_start:
+                break
+            end = min(end, open_start - 1)
+        if current_end is None or start > current_end:
+            total += end - start + 1
+            current_end = end
+        elif end > current_end:
+            total += end - current_end
+            current_end = end
+    return total
+
+
+def _index_rows(data: Dict[str, Any], now_month: int) -> Tuple[set, Dict[str, List], set, List[Tuple], int, Optional[int]]:
+    """Index terms and experience for one CV.
+
+    Ongoing roles are stored open (NULL end month) and their months are not
+    counted here, because they keep growing: ``titles`` maps each title to
+    ``[closed_months, open_start]`` and the career total is returned the same
+    way, as closed months before the earliest open role plus that
+    ``open_start``. Queries add ``now - open_start + 1`` at search time.
+    Overlapping roles count once, in the career total and per title alike.
+    """
+    skills = {normalize_skill(s) for s in _skill_names(data)} - {""}
+    title_spans: Dict[str, List[Tuple[int, int]]] = {}
+    title_open: Dict[str, int] = {}
+    companies = set()
+    roles = []
+    spans = []
+    open_starts = []
+    for role in data.get("work_experience") or []:
+        if not isinstance(role, dict):
+            continue
+        title = normalize_title(role.get("title") or "")
+        company = normalize_company(role.get("company") or "")
+        start = parse_month(role.get("start_date"), now_month)
+        is_open = start is not None and is_open_ended(role.get("end_date"))
+        end = None if is_open else parse_month(role.get("end_date"), now_month, end=True)
+        if start is not None and end is None and not is_open and not role.get("end_date"):
+            end = start
+        if start is not None and end is not None and end < start:
+            start, end = end, start
+        if title:
+            title_spans.setdefault(title, [])
+            if is_open:
+                title_open[title] = min(title_open.get(title, start), start)
+            elif start is not None and end is not None:
+                title_spans[title].append((start, end))
+        if company:
+            companies.add(company)
+        if is_open:
+            open_starts.append(start)
+        elif start is not None and end is not None:
+            spans.append((start, end))
+        roles.append((title or None, company or None, start, end))
+
+    titles = {title: [_closed_months(title_spans[title], title_open.get(title)), title_open.get(title)]
+              for title in title_spans}
+    open_start = min(open_starts) if open_starts else None
+    return skills, titles, companies, roles, _closed_months(spans, open_start), open_start
+
+
+def _doc_hash(data: Dict[str, Any]) -> str:
+    """Stable identity for a parsed CV: its source text, else its content"""
+    basis = data.get("extracted_text") or json.dumps(
+        {k: v for k, v in data.items() if k != "_metadata"}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+class CVStore:
+    """SQLite store for parsed CV results.
+
+    Each CV is stored once (keyed by a hash of its extracted text) with its
+    full JSON, and its normalized skills, titles and companies go into
+    ``WITHOUT ROWID`` tables keyed ``(term, cv_id)`` so every filter is an
+    index range scan. Queries intersect those id sets and page over the
+    result, so cost tracks the matches rather than the size of the store.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=OFF")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+
+    def reindex(self):
+        """Rebuild every index row from the stored results, e.g. after indexing rules change"""
+        now = datetime.now()
+        now_month = now.year * 12 + now.month - 1
+        with self.conn:
+            for table in INDEX_TABLES:
+                self.conn.execute(f"DELETE FROM {table}")
+            pending: Dict[int, Tuple] = {}
+            for row in self.conn.execute("SELECT id, data FROM cvs").fetchall():
+                skills, titles, companies, roles, total, open_start = _index_rows(json.loads(row["data"]), now_month)
+                self.conn.execute("UPDATE cvs SET total_months = ?, open_start = ? WHERE id = ?",
+                                  (total, open_start, row["id"]))
+                pending[row["id"]] = (skills, titles, companies, roles)
+            self._insert_index_rows(pending)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def add(self, data: Dict[str, Any]) -> int:
+        """Store a single parsed CV and return its id"""
+        return self.add_many([data])[0]
+
+    def add_many(self, results: Iterable[Dict[str, Any]], batch_size: int = 1000) -> List[int]:
+        """Bulk insert parsed CVs, committing once per batch.
+
+        Re-adding a CV with the same extracted text replaces the stored copy
+        and its index rows. Results carrying an ``error`` key are skipped.
+        """
+        now = datetime.now()
+        now_month = now.year * 12 + now.month - 1
+        stored_at = now.isoformat()
+        ids: List[int] = []
+        batch: List[Dict[str, Any]] = []
+        for data in results:
+            if not isinstance(data, dict) or data.get("error"):
+                continue
+            batch.append(data)
+            if len(batch) >= batch_size:
+                ids.extend(self._insert_batch(batch, now_month, stored_at))
+                batch = []
+        if batch:
+            ids.extend(self._insert_batch(batch, now_month, stored_at))
+        return ids
+
+    def _insert_batch(self, batch: List[Dict[str, Any]], now_month: int, stored_at: str) -> List[int]:
+        ids: List[int] = []
+        # Index rows per CV id, so a CV repeated within a batch is indexed once
+        pending: Dict[int, Tuple] = {}
+        with self.conn:
+            for data in batch:
+                personal = data.get("personal_info") or {}
+                doc_hash = _doc_hash(data)
+                skills, titles, companies, roles, total, open_start = _index_rows(data, now_month)
+                row = (data.get("file_path") or (data.get("_metadata") or {}).get("source_file"),
+                       personal.get("name"), personal.get("email"), total, open_start, data.get("analyzed_at"),
+                       stored_at, json.dumps(data, ensure_ascii=False))
+                existing = self.conn.execute("SELECT id FROM cvs WHERE doc_hash = ?", (doc_hash,)).fetchone()
+                if existing:
+                    cv_id = existing[0]
+                    self.conn.execute(
+                        """UPDATE cvs SET source_file = ?, name = ?, email = ?, total_months = ?, open_start = ?,
+                           analyzed_at = ?, stored_at = ?, data = ? WHERE id = ?""", row + (cv_id,))
+                    if cv_id not in pending:
+                        for table in INDEX_TABLES:
+                            self.conn.execute(f"DELETE FROM {table} WHERE cv_id = ?", (cv_id,))
+                else:
+                    cv_id = self.conn.execute(
+                        """INSERT INTO cvs (source_file, name, email, total_months, open_start, analyzed_at, stored_at,
+                           data, doc_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""", row + (doc_hash,)).lastrowid
+                ids.append(cv_id)
+                pending[cv_id] = (skills, titles, companies, roles)
+            self._insert_index_rows(pending)
+        return ids
+
+    def _insert_index_rows(self, pending: Dict[int, Tuple]):
+        skill_rows, title_rows, company_rows, role_rows = [], [], [], []
+        for cv_id, (skills, titles, companies, roles) in pending.items():
+            skill_rows.extend((term, cv_id) for term in skills)
+            title_rows.extend((term, cv_id, months, open_start) for term, (months, open_start) in titles.items())
+            company_rows.extend((term, cv_id) for term in companies)
+            role_rows.extend((cv_id, *role) for role in roles)
+        self.conn.executemany("INSERT OR IGNORE INTO cv_skills (term, cv_id) VALUES (?, ?)", skill_rows)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO cv_titles (term, cv_id, months, open_start) VALUES (?, ?, ?, ?)", title_rows)
+        self.conn.executemany("INSERT OR IGNORE INTO cv_companies (term, cv_id) VALUES (?, ?)", company_rows)
+        self.conn.executemany(
+            "INSERT INTO cv_roles (cv_id, title, company, start_month, end_month) VALUES (?, ?, ?, ?, ?)", role_rows)
+
+    def get(self, cv_id: int) -> Optional[Dict[str, Any]]:
+        """Return the stored result for an id"""
+        row = self.conn.execute("SELECT data FROM cvs WHERE id = ?", (cv_id,)).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def delete(self, cv_id: int) -> bool:
+        with self.conn:
+            for table in INDEX_TABLES:
+                self.conn.execute(f"DELETE FROM {table} WHERE cv_id = ?", (cv_id,))
+            return self.conn.execute("DELETE FROM cvs WHERE id = ?", (cv_id,)).rowcount > 0
+
+    def search(self, skills: Optional[List[str]] = None, titles: Optional[List[str]] = None,
+               companies: Optional[List[str]] = None, min_years: Optional[float] = None,
+               active_since: Optional[str] = None, active_until: Optional[str] = None,
+               page: int = 1, per_page: int = 20, after_id: Optional[int] = None) -> Dict[str, Any]:
+        """Find CVs matching every given filter.
+
+        ``skills`` and ``companies`` must all be present. ``titles`` match any
+        of the given titles; with ``min_years`` the years are counted in those
+        titles, otherwise across the whole career. ``active_since`` and
+        ``active_until`` (e.g. "2020" or "03/2021") keep CVs with a role
+        overlapping that window. Pages are 1-based; pass the last id of a page
+        as ``after_id`` for keyset paging, which stays fast at deep pages.
+        """
+        parts: List[str] = []
+        params: List[Any] = []
+        now = datetime.now()
+        now_month = now.year * 12 + now.month - 1
+
+        for skill in skills or []:
+            parts.append("SELECT cv_id FROM cv_skills WHERE term = ?")
+            params.append(normalize_skill(skill))
+        for company in companies or []:
+            parts.append("SELECT cv_id FROM cv_companies WHERE term = ?")
+            params.append(normalize_company(company))
+        if titles:
+            title_terms = [normalize_title(t) for t in titles]
+            placeholders = ", ".join("?" for _ in title_terms)
+            if min_years is not None:
+                # Ongoing roles count up to the current month
+                parts.append(f"SELECT cv_id FROM cv_titles WHERE term IN ({placeholders}) GROUP BY cv_id "
+                             f"HAVING SUM(months + IFNULL(MAX(? - open_start + 1, 0), 0)) >= ?")
+                params.extend(title_terms + [now_month, int(round(min_years * 12))])
+            else:
+                parts.append(f"SELECT cv_id FROM cv_titles WHERE term IN ({placeholders})")
+                params.extend(title_terms)
+        elif min_years is not None:
+            # total + (now - open_start + 1) >= needed, rearranged so each
+            # side of the OR is an index range scan
+            needed = int(round(min_years * 12))
+            parts.append("SELECT id FROM cvs WHERE total_months >= ? "
+                         "OR (open_start IS NOT NULL AND open_start - total_months <= ?)")
+            params.extend([needed, now_month + 1 - needed])
+
+        since = parse_month(active_since, now_month) if active_since else None
+        until = parse_month(active_until, now_month, end=True) if active_until else None
+        if since is not None or until is not None:
+            conditions = []
+            if since is not None:
+                conditions.append("(end_month IS NULL OR end_month >= ?)")
+                params.append(since)
+            if until is not None:
+                conditions.append("start_month <= ?")
+                params.append(until)
+            parts.append("SELECT cv_id FROM cv_roles WHERE " + " AND ".join(conditions))
+
+        matched = " INTERSECT ".join(parts) if parts else "SELECT id FROM cvs"
+        total = self.conn.execute(f"SELECT COUNT(*) FROM ({matched})", params).fetchone()[0]
+
+        per_page = max(1, min(per_page, 500))
+        query = (f"SELECT id, source_file, name, email, analyzed_at, "
+                 f"total_months + IFNULL(MAX(? - open_start + 1, 0), 0) AS total_months FROM cvs "
+                 f"WHERE id IN ({matched})")
+        query_params = [now_month] + params
+        if after_id is not None:
+            query += " AND id > ?"
+            query_params.append(after_id)
+            query += " ORDER BY id LIMIT ?"
+            query_params.append(per_page)
+        else:
+            query += " ORDER BY id LIMIT ? OFFSET ?"
+            query_params.extend([per_page, (max(page, 1) - 1) * per_page])
+
+        results = [{
+            "id": row["id"],
+            "name": row["name"],
+            "email": row["email"],
+            "source_file": row["source_file"],
+            "years_experience": round(row["total_months"] / 12, 1),
+            "analyzed_at": row["analyzed_at"],
+        } for row in self.conn.execute(query, query_params)]
+
+        return {
+            "total": total,
+            "page": page if after_id is None else None,
+            "per_page": per_page,
+            "next_after_id": results[-1]["id"] if len(results) == per_page else None,
+            "results": results,
+        }
+
+    def roles(self, cv_id: int) -> List[Dict[str, Any]]:
+        """Return the indexed roles of a CV with normalized dates"""
+        return [{
+            "title": row["title"],
+            "company": row["company"],
+            "start": _month_label(row["start_month"]),
+            "end": _month_label(row["end_month"]) if row["end_month"] is not None or row["start_month"] is None
+            else "Present",
+        } for row in self.conn.execute(
+            "SELECT title, company, start_month, end_month FROM cv_roles WHERE cv_id = ? ORDER BY start_month DESC",
+            (cv_id,))]
+
+    def stats(self) -> Dict[str, Any]:
+        counts = {table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in ("cvs",) + INDEX_TABLES}
+        top_skills = [
+            {"skill": row[0], "count": row[1]} for row in self.conn.execute(
+                "SELECT term, COUNT(*) AS n FROM cv_skills GROUP BY term ORDER BY n DESC LIMIT 20")
+        ]
+        return {"db_path": self.db_path, "counts": counts, "top_skills": top_skills}
+
+
+def _read_results(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """Yield results from JSON files, JSONL files (streamed) or stdin ("-" as JSONL)"""
+    for path in paths:
+        if path == "-" or path.endswith(".jsonl"):
+            handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+            try:
+                for line in handle:
+                    if line.strip():
+                        yield json.loads(line)
+            finally:
+                if handle is not sys.stdin:
+                    handle.close()
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            parsed = json.load(f)
+        if isinstance(parsed, list):
+            yield from parsed
+        else:
+            yield parsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Store and search parsed CV results')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help='SQLite database path (defaults to CV_STORE_PATH)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add_cmd = commands.add_parser('add', help='Store parsed CV results from JSON/JSONL files')
+    add_cmd.add_argument('files', nargs='+', help='Result files, or - for stdin')
+    add_cmd.add_argument('--batch-size', type=int, default=1000)
+
+    search_cmd = commands.add_parser('search', help='Search stored CVs')
+    search_cmd.add_argument('--skill', action='append', default=[], help='Required skill (repeatable)')
+    search_cmd.add_argument('--title', action='append', default=[], help='Job title, any of (repeatable)')
+    search_cmd.add_argument('--company', action='append', default=[], help='Required company (repeatable)')
+    search_cmd.add_argument('--min-years', type=float, help='Minimum years in the given titles, or overall')
+    search_cmd.add_argument('--active-since', help='Has a role ending on/after this date, e.g. 2021 or 03/2021')
+    search_cmd.add_argument('--active-until', help='Has a role starting on/before this date')
+    search_cmd.add_argument('--page', type=int, default=1)
+    search_cmd.add_argument('--per-page', type=int, default=20)
+    search_cmd.add_argument('--after-id', type=int, help='Keyset cursor from a previous page')
+
+    get_cmd = commands.add_parser('get', help='Print a stored result')
+    get_cmd.add_argument('id', type=int)
+
+    commands.add_parser('stats', help='Show store counts')
+    commands.add_parser('reindex', help='Rebuild the search indexes from the stored results')
+
+    args = parser.parse_args()
+
+    with CVStore(args.db) as store:
+        if args.command == 'add':
+            ids = store.add_many(_read_results(args.files), batch_size=args.batch_size)
+            result = {"stored": len(ids), "ids": ids[:100]}
+        elif args.command == 'search':
+            result = store.search(skills=args.skill, titles=args.title, companies=args.company,
+                                  min_years=args.min_years, active_since=args.active_since,
+                                  active_until=args.active_until, page=args.page,
+                                  per_page=args.per_page, after_id=args.after_id)
+        elif args.command == 'get':
+            result = store.get(args.id)
+            if result is None:
+                print(json.dumps({"error": f"No CV with id {args.id}"}), file=sys.stderr)
+                sys.exit(1)
+            result["_roles"] = store.roles(args.id)
+        elif args.command == 'reindex':
+            store.reindex()
+            result = store.stats()
+        else:
+            result = store.stats()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -109,6 +109,11 @@ export async function POST(request: NextRequest) {
   }
 }
 
+// Hard kill after 5 minutes; the parser gets a slightly shorter budget so it
+// can stop early and return partial results before we have to kill it
+const PARSER_TIMEOUT_MS = 5 * 60 * 1000
+const PARSER_BUDGET_SECONDS = PARSER_TIMEOUT_MS / 1000 - 15
+
 function runPythonParser(scriptPath: string, filePath: string, jobDescription: string): Promise<any> {
   return new Promise((resolve, reject) => {
     const pythonPath = process.env.PYTHON_PATH || 'python3'
@@ -117,6 +122,7 @@ function runPythonParser(scriptPath: string, filePath: string, jobDescription: s
     if (jobDescription) {
       args.push(jobDescription)
     }
+    args.push('--budget', String(PARSER_BUDGET_SECONDS))
 
     console.log('Executing:', pythonPath, args.join(' '))
 
@@ -171,6 +177,6 @@ function runPythonParser(scriptPath: string, filePath: string, jobDescription: s
       resolve({ 
         error: 'Python parser timed out after 5 minutes' 
       })
-    }, 5 * 60 * 1000)
+    }, PARSER_TIMEOUT_MS)
   })
 }
\ No newline at end of file